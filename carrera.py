@@ -0,0 +1,355 @@
+import multiprocessing
+import os
+import queue
+import signal
+from time import perf_counter
+
+from pulp import *
+
+from cotas import alcanza_cota
+
+
+MARGEN_TIEMPO = 5 # Segundos extra para que los solvers informen su mejor solución al llegar al límite
+
+
+def solucion_greedy(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int = 1,
+    cantidad_de_dobles: int = 1,
+    max_turnos_por_dia: int = None
+):
+    """
+    Busca rápidamente una asignación factible eligiendo siempre la preferencia más barata.
+
+    Recorre primero los turnos con menos margen entre empleados disponibles y demanda,
+    cubre los roles y la demanda total de cada uno y luego completa los turnos deseados de
+    cada empleado con sus turnos más baratos. No garantiza encontrar una solución.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        cantidad_de_francos (int): Cantidad mínima de días de descanso por empleado.
+        cantidad_de_dobles (int): Cantidad máxima de días con más de un turno por empleado.
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+
+    Returns:
+        set: Pares (turno, empleado) asignados, o None si no encontró una asignación factible.
+    """
+    Q, U, P, D, B, V = (parametros[k] for k in ("Q", "U", "P", "D", "B", "V"))
+    dias = parametros["dias"]
+    turnos = parametros["turnos"]
+    solapados = parametros["solapados"]
+    H, Hmax = parametros["H"], parametros["Hmax"]
+    dia_de = {t: m for m in dias for t in parametros["turnos_por_dia"][m]}
+
+    asignados = set()
+    restantes = dict(U)
+    horas = {e: 0 for e in empleados}
+    turnos_en_dia = {e: {m: 0 for m in dias} for e in empleados}
+    dobles_usados = {e: 0 for e in empleados}
+
+    def puede(t, e):
+        if not D[t][e] or (t, e) in asignados or restantes[e] <= 0:
+            return False
+        if any((s, e) in asignados for s in solapados[t]):
+            return False
+        n = turnos_en_dia[e][dia_de[t]]
+        if n == 0 and sum(c > 0 for c in turnos_en_dia[e].values()) >= len(dias) - cantidad_de_francos:
+            return False
+        if n == 1 and dobles_usados[e] >= cantidad_de_dobles:
+            return False
+        if max_turnos_por_dia is not None and n >= max_turnos_por_dia:
+            return False
+        return Hmax[e] is None or horas[e] + H[t] <= Hmax[e]
+
+    def asignar(t, e):
+        asignados.add((t, e))
+        restantes[e] -= 1
+        horas[e] += H[t]
+        turnos_en_dia[e][dia_de[t]] += 1
+        if turnos_en_dia[e][dia_de[t]] == 2:
+            dobles_usados[e] += 1
+
+    def cubrir(t, faltan, calificados):
+        for _ in range(faltan):
+            candidatos = [e for e in calificados if puede(t, e)]
+            if not candidatos:
+                return False
+            asignar(t, min(candidatos, key=lambda e: (P[t][e], -restantes[e])))
+        return True
+
+    for t in sorted(turnos, key=lambda t: sum(D[t][e] for e in empleados) - Q[t]):
+        for r in roles:
+            cubiertos = sum(B[r][e] for e in empleados if (t, e) in asignados)
+            if not cubrir(t, V[t][r] - cubiertos, [e for e in empleados if B[r][e]]):
+                return None
+        if not cubrir(t, Q[t] - sum((t, e) in asignados for e in empleados), empleados):
+            return None
+
+    for e in empleados:
+        while restantes[e] > 0:
+            candidatos = [t for t in turnos if puede(t, e)]
+            if not candidatos:
+                return None
+            asignar(min(candidatos, key=lambda t: P[t][e]), e)
+
+    return asignados
+
+
+def cargar_solucion(asignacion: set, parametros: dict, x: dict, y: dict, w: dict, z: dict, aux: LpVariable):
+    """
+    Carga una asignación (por ejemplo, la de `solucion_greedy`) como valores de las variables del modelo.
+
+    Sirve como solución inicial para `resolver_en_carrera`.
+    """
+    for t in x:
+        for e in x[t]:
+            x[t][e].varValue = 1 if (t, e) in asignacion else 0
+    for m in y:
+        for e in y[m]:
+            trabajados = sum((t, e) in asignacion for t in parametros["turnos_por_dia"][m])
+            y[m][e].varValue = 1 if trabajados >= 1 else 0
+            w[m][e].varValue = 1 - y[m][e].varValue
+            z[m][e].varValue = 1 if trabajados >= 2 else 0
+    aux.varValue = 0 # 'aux' suma en el objetivo, su mejor valor factible es 0
+
+
+def configuraciones_por_defecto():
+    """
+    Devuelve las configuraciones de solver que compiten en `resolver_en_carrera`.
+
+    Incluye CBC con distintas semillas y estrategias y, si SciPy está instalado, HiGHS.
+
+    Returns:
+        list: Diccionarios con 'nombre', 'solver' ('cbc' o 'highs') y 'opciones' (opciones de línea de CBC).
+    """
+    configuraciones = [
+        {"nombre": "CBC", "solver": "cbc", "opciones": []},
+        {"nombre": "CBC semilla 2 sin cortes", "solver": "cbc", "opciones": ["randomCbcSeed 2", "randomSeed 2", "cuts off"]},
+        {"nombre": "CBC semilla 3 en profundidad", "solver": "cbc", "opciones": ["randomCbcSeed 3", "randomSeed 3", "nodeStrategy depthFirst"]},
+        {"nombre": "CBC semilla 4 proximity", "solver": "cbc", "opciones": ["randomCbcSeed 4", "randomSeed 4", "proximity on"]},
+    ]
+    try:
+        import scipy.optimize  # noqa: F401
+        configuraciones.append({"nombre": "HiGHS (SciPy)", "solver": "highs", "opciones": []})
+    except ImportError:
+        pass
+    return configuraciones
+
+
+def _resolver_con_highs(prob, tiempo_limite):
+    import numpy as np
+    from scipy.optimize import Bounds, LinearConstraint, milp
+    from scipy.sparse import lil_matrix
+
+    variables = prob.variables()
+    indice = {v.name: i for i, v in enumerate(variables)}
+
+    c = np.zeros(len(variables))
+    for v, coeficiente in prob.objective.items():
+        c[indice[v.name]] = coeficiente
+
+    restricciones = list(prob.constraints.values())
+    A = lil_matrix((len(restricciones), len(variables)))
+    inferior = np.full(len(restricciones), -np.inf)
+    superior = np.full(len(restricciones), np.inf)
+    for i, restriccion in enumerate(restricciones):
+        for v, coeficiente in restriccion.items():
+            A[i, indice[v.name]] = coeficiente
+        lado_derecho = -restriccion.constant
+        if restriccion.sense != LpConstraintLE:
+            inferior[i] = lado_derecho
+        if restriccion.sense != LpConstraintGE:
+            superior[i] = lado_derecho
+
+    cotas = Bounds(
+        [v.lowBound if v.lowBound is not None else -np.inf for v in variables],
+        [v.upBound if v.upBound is not None else np.inf for v in variables]
+    )
+    enteras = [1 if v.cat == LpInteger else 0 for v in variables]
+    opciones = {"time_limit": tiempo_limite} if tiempo_limite is not None else {}
+
+    resultado = milp(
+        c, constraints=LinearConstraint(A.tocsr(), inferior, superior),
+        integrality=enteras, bounds=cotas, options=opciones
+    )
+    # Estados de scipy.optimize.milp: 0 óptimo, 1 límite alcanzado, 2 infactible
+    if resultado.x is None:
+        return {"estado": "Infeasible" if resultado.status == 2 else "Not Solved", "optimo_probado": False}
+    valores = {
+        v.name: (round(valor) if v.cat == LpInteger else valor) for v, valor in zip(variables, resultado.x)
+    }
+    return {
+        "estado": "Optimal",
+        "optimo_probado": resultado.status == 0,
+        "valores": valores
+    }
+
+
+def _competidor(configuracion, datos_problema, tiempo_limite, arranque, cola):
+    # Grupo de procesos propio para poder terminar también el ejecutable de CBC al cancelar
+    if hasattr(os, "setsid"):
+        os.setsid()
+    inicio = perf_counter()
+    try:
+        _, prob = LpProblem.fromDict(datos_problema)
+        if configuracion["solver"] == "highs":
+            resultado = _resolver_con_highs(prob, tiempo_limite)
+        else:
+            prob.solve(PULP_CBC_CMD(
+                msg=False, timeLimit=tiempo_limite, warmStart=arranque, options=configuracion["opciones"]
+            ))
+            resultado = {"estado": LpStatus[prob.status], "optimo_probado": prob.sol_status == LpSolutionOptimal}
+            if prob.sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible):
+                resultado["valores"] = {v.name: v.varValue for v in prob.variables()}
+    except Exception as e:
+        resultado = {"estado": "Error", "optimo_probado": False, "error": str(e)}
+    resultado["nombre"] = configuracion["nombre"]
+    resultado["tiempo"] = perf_counter() - inicio
+    cola.put(resultado)
+
+
+def _objetivo(prob, valores):
+    # Se calcula sobre el problema original: toDict() no conserva la constante del objetivo
+    return prob.objective.constant + sum(
+        coeficiente * valores.get(v.name, 0) for v, coeficiente in prob.objective.items()
+    )
+
+
+def _terminar(proceso):
+    # Se espera a cada proceso terminado para que la app, que sigue corriendo, no acumule zombies
+    if proceso.is_alive():
+        try:
+            os.killpg(proceso.pid, signal.SIGTERM)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            proceso.terminate()
+    proceso.join(timeout=MARGEN_TIEMPO)
+    if proceso.is_alive():
+        proceso.kill()
+        proceso.join(timeout=MARGEN_TIEMPO)
+
+
+def resolver_en_carrera(
+    prob: LpProblem, tiempo_limite: float = 60, configuraciones: list = None, cota: float = None
+):
+    """
+    Resuelve `prob` con varias configuraciones de solver en paralelo y se queda con la primera que termina.
+
+    Cada configuración corre en su propio proceso. Apenas una demuestra optimalidad (o
+    infactibilidad) se cancelan las demás. Si se alcanza el tiempo límite se usa la mejor
+    solución encontrada hasta ese momento.
+
+    Si las variables de `prob` ya tienen valores que forman una solución factible (por ejemplo,
+    la de `solucion_greedy` cargada con `cargar_solucion`), se toma como incumbente inicial y
+    se pasa a CBC como solución de arranque (warm start).
+
+    Si se conoce una cota inferior del objetivo (ver `cotas.cota_inferior`), cualquier solución
+    que la alcance se considera óptima: se cancelan las demás configuraciones sin esperar a que
+    demuestren optimalidad, y si la alcanza la solución inicial no se lanza ninguna.
+
+    Al terminar, los valores de la mejor solución y el estado quedan cargados en `prob`, igual
+    que después de `prob.solve()`.
+
+    Args:
+        prob (LpProblem): Problema a resolver.
+        tiempo_limite (float): Tiempo máximo en segundos para cada configuración.
+        configuraciones (list): Configuraciones a usar (default: `configuraciones_por_defecto()`).
+        cota (float): Cota inferior del objetivo (None = sin cota).
+
+    Returns:
+        dict: Resumen con 'ganador', 'estado', 'optimo_probado', 'optimo_por_cota', 'objetivo',
+            'tiempo' y 'resultados' (estado, objetivo y tiempo de cada configuración que llegó a informar).
+    """
+    if configuraciones is None:
+        configuraciones = configuraciones_por_defecto()
+
+    inicio = perf_counter()
+    resultados = []
+    arranque = prob.valid(1e-6)
+    if arranque:
+        resultados.append({
+            "nombre": "Greedy",
+            "estado": "Optimal",
+            "optimo_probado": False,
+            "objetivo": value(prob.objective),
+            "valores": {v.name: v.varValue for v in prob.variables()},
+            "tiempo": 0.0
+        })
+
+    ganador = None
+    if resultados and alcanza_cota(resultados[0]["objetivo"], cota):
+        ganador = resultados[0]
+        configuraciones = []
+
+    datos_problema = prob.toDict()
+    cola = multiprocessing.Queue()
+    procesos = [
+        multiprocessing.Process(
+            target=_competidor, args=(configuracion, datos_problema, tiempo_limite, arranque, cola), daemon=True
+        )
+        for configuracion in configuraciones
+    ]
+    for proceso in procesos:
+        proceso.start()
+
+    limite = inicio + tiempo_limite + MARGEN_TIEMPO
+    try:
+        for _ in procesos:
+            try:
+                resultado = cola.get(timeout=max(0, limite - perf_counter()))
+            except queue.Empty:
+                break
+            if "valores" in resultado:
+                resultado["objetivo"] = _objetivo(prob, resultado["valores"])
+            resultados.append(resultado)
+            if (
+                resultado["optimo_probado"]
+                or resultado["estado"] == "Infeasible"
+                or alcanza_cota(resultado.get("objetivo"), cota)
+            ):
+                ganador = resultado
+                break
+    finally:
+        for proceso in procesos:
+            _terminar(proceso)
+
+    if ganador is None:
+        factibles = [r for r in resultados if r.get("objetivo") is not None]
+        if factibles:
+            ganador = min(factibles, key=lambda r: r["objetivo"])
+
+    # Sólo cuenta como óptimo por cota si ningún solver lo había demostrado
+    por_cota = (
+        bool(ganador)
+        and ganador["estado"] != "Infeasible"
+        and not ganador["optimo_probado"]
+        and alcanza_cota(ganador.get("objetivo"), cota)
+    )
+    if por_cota:
+        ganador["optimo_probado"] = True
+
+    if ganador is None:
+        prob.assignStatus(LpStatusNotSolved)
+    elif ganador["estado"] == "Infeasible":
+        prob.assignStatus(LpStatusInfeasible, LpSolutionInfeasible)
+    else:
+        for v in prob.variables():
+            v.varValue = ganador["valores"].get(v.name, v.varValue)
+        prob.assignStatus(
+            LpStatusOptimal, LpSolutionOptimal if ganador["optimo_probado"] else LpSolutionIntegerFeasible
+        )
+
+    return {
+        "ganador": ganador["nombre"] if ganador else None,
+        "estado": LpStatus[prob.status],
+        "optimo_probado": bool(ganador and ganador["optimo_probado"]),
+        "optimo_por_cota": por_cota,
+        "objetivo": ganador.get("objetivo") if ganador else None,
+        "tiempo": perf_counter() - inicio,
+        "resultados": [
+            {k: r.get(k) for k in ("nombre", "estado", "optimo_probado", "objetivo", "tiempo")} for r in resultados
+        ]
+    }
@@ -0,0 +1,333 @@
+from bisect import bisect_right
+from collections import deque
+
+import numpy as np
+
+
+def cota_simple(empleados: list, parametros: dict, fijaciones: dict = None):
+    """
+    Cota inferior del objetivo tomando, para cada empleado, sus U[e] turnos disponibles más baratos.
+
+    Ignora la demanda de los turnos y las restricciones por día, por lo que se calcula con
+    un ordenamiento por columna de la matriz de preferencias.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        fijaciones (dict): Resultado de `presolve.propagar` (opcional). Las asignaciones fijadas
+            en 1 se cuentan siempre y las fijadas en 0 se excluyen.
+
+    Returns:
+        float: Cota inferior del objetivo, o infinito si algún empleado no tiene turnos suficientes.
+    """
+    turnos = parametros["turnos"]
+    P, D, U = parametros["P"], parametros["D"], parametros["U"]
+    fijadas = fijaciones["x"] if fijaciones is not None and fijaciones["infactible"] is None else {}
+
+    # Matriz turnos x empleados: costo de los turnos libres, infinito si no se puede elegir
+    costos = np.full((len(turnos), len(empleados)), np.inf)
+    obligatorio = 0.0
+    faltan = np.zeros(len(empleados), dtype=int)
+    for j, e in enumerate(empleados):
+        faltan[j] = U[e]
+        for i, t in enumerate(turnos):
+            valor = fijadas.get((t, e))
+            if valor == 1:
+                obligatorio += P[t][e]
+                faltan[j] -= 1
+            elif valor is None and D[t][e]:
+                costos[i, j] = P[t][e]
+
+    if (faltan < 0).any():
+        return np.inf
+    ordenados = np.sort(costos, axis=0)
+    acumulados = np.vstack([np.zeros(len(empleados)), np.cumsum(ordenados, axis=0)])
+    return obligatorio + float(acumulados[faltan, np.arange(len(empleados))].sum())
+
+
+def cota_flujo(empleados: list, roles: list, parametros: dict, fijaciones: dict = None):
+    """
+    Cota inferior del objetivo con un flujo de costo mínimo que respeta la demanda de cada turno.
+
+    Cada empleado envía exactamente U[e] unidades de flujo (sus turnos) a los turnos donde
+    está disponible, con costo P[t][e], y cada turno debe recibir al menos
+    max(Q[t], V[t][r] para todo r). Es una relajación del modelo (ignora los roles concretos,
+    los días y los dobles), así que su costo nunca supera al óptimo. Siempre es al menos
+    tan buena como `cota_simple`.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        fijaciones (dict): Resultado de `presolve.propagar` (opcional).
+
+    Returns:
+        float: Cota inferior del objetivo, o infinito si el flujo demuestra que el modelo es infactible.
+    """
+    turnos = parametros["turnos"]
+    P, D, U, Q, V = (parametros[k] for k in ("P", "D", "U", "Q", "V"))
+    fijadas = fijaciones["x"] if fijaciones is not None and fijaciones["infactible"] is None else {}
+
+    # Nodos: 0 = fuente, 1..E = empleados, E+1..E+T = turnos, E+T+1 = sumidero
+    fuente, sumidero = 0, len(empleados) + len(turnos) + 1
+    nodo_turno = {t: len(empleados) + 1 + i for i, t in enumerate(turnos)}
+    grafo = [[] for _ in range(sumidero + 1)]  # aristas: [destino, capacidad, costo, índice de la inversa]
+
+    def arista(desde, hasta, capacidad, costo):
+        grafo[desde].append([hasta, capacidad, costo, len(grafo[hasta])])
+        grafo[hasta].append([desde, 0, -costo, len(grafo[desde]) - 1])
+
+    obligatorio = 0.0
+    cubiertos = {t: 0 for t in turnos}
+    flujo_requerido = 0
+    for j, e in enumerate(empleados):
+        restantes = U[e]
+        for t in turnos:
+            valor = fijadas.get((t, e))
+            if valor == 1:
+                obligatorio += P[t][e]
+                cubiertos[t] += 1
+                restantes -= 1
+            elif valor is None and D[t][e]:
+                arista(j + 1, nodo_turno[t], 1, P[t][e])
+        if restantes < 0:
+            return np.inf
+        arista(fuente, j + 1, restantes, 0)
+        flujo_requerido += restantes
+
+    # La demanda mínima se modela con aristas de costo muy negativo: el flujo de costo
+    # mínimo las satura siempre que sea posible, y se verifica al final.
+    penalidad = 1 + sum(P[t][e] for t in turnos for e in empleados)
+    demanda_pendiente = 0
+    for t in turnos:
+        demanda = max([Q[t]] + [V[t][r] for r in roles]) - cubiertos[t]
+        if demanda > 0:
+            arista(nodo_turno[t], sumidero, demanda, -penalidad)
+            demanda_pendiente += demanda
+        arista(nodo_turno[t], sumidero, flujo_requerido, 0)
+
+    flujo, costo = 0, 0.0
+    while flujo < flujo_requerido:
+        # Camino de costo mínimo en la red residual (Bellman-Ford con cola)
+        distancia = [np.inf] * len(grafo)
+        previo = [None] * len(grafo)
+        en_cola = [False] * len(grafo)
+        distancia[fuente] = 0
+        cola = deque([fuente])
+        while cola:
+            u = cola.popleft()
+            en_cola[u] = False
+            for k, (v, capacidad, costo_arista, _) in enumerate(grafo[u]):
+                # Con preferencias no enteras, la tolerancia evita ciclar por errores de redondeo
+                if capacidad > 0 and distancia[u] + costo_arista < distancia[v] - 1e-9:
+                    distancia[v] = distancia[u] + costo_arista
+                    previo[v] = (u, k)
+                    if not en_cola[v]:
+                        en_cola[v] = True
+                        cola.append(v)
+        if distancia[sumidero] == np.inf:
+            return np.inf  # Algún empleado no puede completar sus turnos
+
+        aumento = flujo_requerido - flujo
+        v = sumidero
+        while v != fuente:
+            u, k = previo[v]
+            aumento = min(aumento, grafo[u][k][1])
+            v = u
+        v = sumidero
+        while v != fuente:
+            u, k = previo[v]
+            grafo[u][k][1] -= aumento
+            grafo[v][grafo[u][k][3]][1] += aumento
+            v = u
+        flujo += aumento
+        costo += aumento * distancia[sumidero]
+
+    # Si quedó demanda sin cubrir, el costo conserva parte de la penalidad: el modelo es infactible
+    costo += penalidad * demanda_pendiente
+    if costo >= penalidad:
+        return np.inf
+    return obligatorio + costo
+
+
+def _mejores_del_dia(turnos_dia: list, costos: dict, obligatorios: set, horarios: dict, maximo: int):
+    # Para k = 0..maximo, los k turnos del día sin superponerse de menor costo que incluyen a los
+    # obligatorios: programación dinámica sobre los turnos ordenados por fin (intervalos ponderados).
+    orden = sorted((t for t in turnos_dia if t in costos), key=lambda t: horarios[t][1])
+    fines = [horarios[t][1] for t in orden]
+    compatibles = [bisect_right(fines, horarios[t][0]) for t in orden]  # Turnos que terminan antes
+    obligatorios_hasta = np.cumsum([0] + [t in obligatorios for t in orden])
+
+    # mejor[i][k]: costo mínimo con k turnos entre los primeros i; eleccion[i][k]: si usa el i-ésimo
+    mejor = [[np.inf] * (maximo + 1) for _ in range(len(orden) + 1)]
+    eleccion = [[False] * (maximo + 1) for _ in range(len(orden) + 1)]
+    mejor[0][0] = 0.0
+    for i, t in enumerate(orden, start=1):
+        c = compatibles[i - 1]
+        # Elegir t saltea los turnos entre c e i - 1, que se superponen con él: no pueden ser obligatorios
+        puede_elegir = obligatorios_hasta[i - 1] == obligatorios_hasta[c]
+        for k in range(maximo + 1):
+            if t not in obligatorios:
+                mejor[i][k] = mejor[i - 1][k]
+            if k > 0 and puede_elegir and costos[t] + mejor[c][k - 1] < mejor[i][k]:
+                mejor[i][k] = costos[t] + mejor[c][k - 1]
+                eleccion[i][k] = True
+
+    resultado = []
+    for k in range(maximo + 1):
+        elegidos, i, resto = [], len(orden), k
+        if mejor[i][k] < np.inf:
+            while i > 0:
+                if eleccion[i][resto]:
+                    elegidos.append(orden[i - 1])
+                    i, resto = compatibles[i - 1], resto - 1
+                else:
+                    i -= 1
+        resultado.append((mejor[len(orden)][k], elegidos))
+    return resultado
+
+
+def _mejor_semana(opciones_por_dia: list, turnos_deseados: int, max_dias: int, max_dobles: int):
+    # Programación dinámica sobre los días con estado (turnos, días trabajados, dobles usados)
+    estados = {(0, 0, 0): (0.0, [])}
+    for opciones in opciones_por_dia:
+        siguientes = {}
+        for (turnos, dias, dobles), (costo, elegidos) in estados.items():
+            for k, (costo_dia, elegidos_dia) in enumerate(opciones):
+                estado = (turnos + k, dias + (k > 0), dobles + (k > 1))
+                if costo_dia == np.inf or estado[0] > turnos_deseados or estado[1] > max_dias or estado[2] > max_dobles:
+                    continue
+                if estado not in siguientes or costo + costo_dia < siguientes[estado][0]:
+                    siguientes[estado] = (costo + costo_dia, elegidos + elegidos_dia)
+        estados = siguientes
+    finales = [valor for (turnos, _, _), valor in estados.items() if turnos == turnos_deseados]
+    return min(finales, key=lambda valor: valor[0]) if finales else (np.inf, [])
+
+
+def cota_lagrangiana(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int = 1,
+    cantidad_de_dobles: int = 1,
+    max_turnos_por_dia: int = None,
+    fijaciones: dict = None,
+    iteraciones: int = 60
+):
+    """
+    Cota inferior del objetivo por relajación lagrangiana de la demanda y de los roles.
+
+    Al pasar la demanda de cada turno (Q) y de cada rol (V) al objetivo con multiplicadores,
+    el modelo se separa por empleado: cada uno elige sus U[e] turnos con una programación
+    dinámica sobre los días que respeta los francos, los dobles, el máximo por día y los
+    solapamientos dentro del día. Esa estructura entera es la que la relajación lineal no
+    tiene, por lo que la cota puede superar a la del solver en el nodo raíz. Los
+    multiplicadores se ajustan por subgradiente; cualquier valor no negativo da una cota válida.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        cantidad_de_francos (int): Cantidad mínima de días de descanso por empleado.
+        cantidad_de_dobles (int): Cantidad máxima de días con más de un turno por empleado.
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+        fijaciones (dict): Resultado de `presolve.propagar` (opcional).
+        iteraciones (int): Cantidad de pasos de subgradiente.
+
+    Returns:
+        float: Cota inferior del objetivo, o infinito si algún empleado no puede completar sus turnos.
+    """
+    dias, turnos, turnos_por_dia = parametros["dias"], parametros["turnos"], parametros["turnos_por_dia"]
+    horarios = parametros["horarios"]
+    P, D, U, Q, V, B = (parametros[k] for k in ("P", "D", "U", "Q", "V", "B"))
+    fijadas = fijaciones["x"] if fijaciones is not None and fijaciones["infactible"] is None else {}
+    max_dias = len(dias) - cantidad_de_francos
+    if max_dias < 0:
+        return np.inf
+
+    disponibles = {e: [t for t in turnos if D[t][e] and fijadas.get((t, e)) != 0] for e in empleados}
+    obligatorios = {e: {t for t in turnos if fijadas.get((t, e)) == 1} for e in empleados}
+    roles_de = {e: [r for r in roles if B[r][e]] for e in empleados}
+
+    lam = {t: 0.0 for t in turnos}
+    mu = {(t, r): 0.0 for t in turnos for r in roles}
+    paso = max([abs(P[t][e]) for t in turnos for e in empleados] + [1.0])
+    mejor = -np.inf
+    for _ in range(iteraciones):
+        valor = sum(lam[t] * Q[t] for t in turnos) + sum(mu[t, r] * V[t][r] for t, r in mu)
+        cubiertos = {t: 0 for t in turnos}
+        cubiertos_rol = {clave: 0 for clave in mu}
+        for e in empleados:
+            costos = {t: P[t][e] - lam[t] - sum(mu[t, r] for r in roles_de[e]) for t in disponibles[e]}
+            opciones = []
+            for m in dias:
+                maximo = len(turnos_por_dia[m]) if max_turnos_por_dia is None else max_turnos_por_dia
+                opciones.append(_mejores_del_dia(turnos_por_dia[m], costos, obligatorios[e], horarios, maximo))
+            costo, elegidos = _mejor_semana(opciones, U[e], max_dias, cantidad_de_dobles)
+            if costo == np.inf:
+                return np.inf  # Ni sin demanda el empleado puede completar sus turnos
+            valor += costo
+            for t in elegidos:
+                cubiertos[t] += 1
+                for r in roles_de[e]:
+                    cubiertos_rol[t, r] += 1
+        mejor = max(mejor, valor)
+
+        # Subgradiente: demanda no cubierta por las elecciones de los empleados
+        faltante = {t: Q[t] - cubiertos[t] for t in turnos}
+        faltante_rol = {clave: V[clave[0]][clave[1]] - cubiertos_rol[clave] for clave in mu}
+        norma = np.sqrt(sum(g * g for g in faltante.values()) + sum(g * g for g in faltante_rol.values()))
+        if norma == 0:
+            break  # Subgradiente nulo: los multiplicadores ya no cambian
+        for t in turnos:
+            lam[t] = max(0.0, lam[t] + paso * faltante[t] / norma)
+        for clave in mu:
+            mu[clave] = max(0.0, mu[clave] + paso * faltante_rol[clave] / norma)
+        paso *= 0.9
+    return mejor
+
+
+def cota_inferior(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int = 1,
+    cantidad_de_dobles: int = 1,
+    max_turnos_por_dia: int = None,
+    fijaciones: dict = None
+):
+    """
+    Devuelve la mejor cota inferior disponible del objetivo `sum x[t][e] * P[t][e] + aux`.
+
+    Combina el flujo de costo mínimo (que cubre exactamente la demanda) con la relajación
+    lagrangiana (que respeta la estructura por día de cada empleado). Si todas las preferencias
+    son enteras el objetivo también lo es y la cota se redondea hacia arriba. Si no, se descuenta
+    una tolerancia para que los errores de redondeo no dejen afuera al óptimo. 'aux' no aporta
+    a la cota porque su valor óptimo es 0.
+
+    Returns:
+        float: Cota inferior del objetivo, o infinito si se demostró que el modelo es infactible.
+    """
+    cota = max(
+        cota_simple(empleados, parametros, fijaciones),
+        cota_flujo(empleados, roles, parametros, fijaciones),
+        cota_lagrangiana(
+            empleados, roles, parametros, cantidad_de_francos, cantidad_de_dobles, max_turnos_por_dia, fijaciones
+        )
+    )
+    if not np.isfinite(cota):
+        return cota
+    P = parametros["P"]
+    if all(float(P[t][e]).is_integer() for t in parametros["turnos"] for e in empleados):
+        return float(np.ceil(cota - 1e-6))
+    return cota - 1e-6
+
+
+def alcanza_cota(objetivo, cota, tolerancia=1e-6):
+    """
+    Indica si un valor del objetivo alcanza la cota inferior, lo que demuestra que es óptimo.
+
+    Returns:
+        bool: True si hay objetivo y cota, y el objetivo no supera la cota (con tolerancia).
+    """
+    return objetivo is not None and cota is not None and objetivo <= cota + tolerancia
@@ -0,0 +1,50 @@
+# Escenario de prueba compartido por los scripts prueba_*.py, en el formato JSON que acepta
+# POST /planificar (ver servicio.py). Usar `servicio.parametros_desde_json` para obtener los
+# parámetros del modelo.
+
+# Todos los días, dos turnos por día
+days = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+shifts = ["TM", "TT"]
+turnos_test = [f"{day} {shift}" for day in days for shift in shifts]
+
+empleados_test = ["Enc TM", "Enc TT", "Caj LD", "Caj LV", "Moz LD", "Caj Moz"]
+roles_test = ["Encargado", "Cajero", "Mozo"]
+
+escenario_test = {
+    "empleados": empleados_test,
+    "roles": roles_test,
+    "habilidades": {
+        "Enc TM": {"Encargado": True, "Cajero": False, "Mozo": False},
+        "Enc TT": {"Encargado": True, "Cajero": False, "Mozo": False},
+        "Caj LD": {"Encargado": False, "Cajero": True, "Mozo": False},
+        "Caj LV": {"Encargado": False, "Cajero": True, "Mozo": True},
+        "Moz LD": {"Encargado": False, "Cajero": False, "Mozo": True},
+        "Caj Moz": {"Encargado": False, "Cajero": True, "Mozo": True}
+    },
+    # Enc TM prefiere la mañana, Enc TT la tarde y Caj LV no trabaja los fines de semana
+    "preferencias": {
+        turno: {
+            "Enc TM": 5 if turno.endswith("TT") else 1,
+            "Enc TT": 5 if turno.endswith("TM") else 1,
+            "Caj LD": 2,
+            "Caj LV": 0 if turno.startswith(("Sábado", "Domingo")) else 1,
+            "Moz LD": 3,
+            "Caj Moz": 2
+        }
+        for turno in turnos_test
+    },
+    "requisitos_roles": {
+        turno: {
+            "Encargado": 1,
+            "Cajero": 1,
+            "Mozo": 1 if turno.startswith(("Sábado", "Domingo")) else 0
+        }
+        for turno in turnos_test
+    },
+    "turnos_deseados": {"Enc TM": 7, "Enc TT": 7, "Caj LD": 7, "Caj LV": 4, "Moz LD": 7, "Caj Moz": 5},
+    "empleados_necesarios": {
+        turno: (3 if turno.startswith(("Sábado", "Domingo")) else 2) for turno in turnos_test
+    },
+    "cantidad_de_francos": 1,
+    "cantidad_de_dobles": 1
+}
@@ -0,0 +1,171 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from modelo import resolver_desde_parametros
+
+
+def ajustar_demanda(parametros: dict, delta: int):
+    """
+    Devuelve una copia de los parámetros con la demanda total de cada turno desplazada en `delta`.
+
+    Args:
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        delta (int): Empleados a sumar (o restar) en 'Empleados Necesarios' de cada turno.
+
+    Returns:
+        dict: Parámetros con 'Q' ajustado (nunca por debajo de 0).
+    """
+    ajustados = dict(parametros)
+    ajustados["Q"] = {t: max(0, q + delta) for t, q in parametros["Q"].items()}
+    return ajustados
+
+
+def chequeo_rapido(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int,
+    cantidad_de_dobles: int,
+    max_turnos_por_dia: int = None
+):
+    """
+    Verifica condiciones necesarias baratas antes de resolver un escenario.
+
+    Si alguna no se cumple el escenario es seguro infactible y no hace falta llamar al
+    solver. Que todas se cumplan no garantiza que el escenario sea factible.
+
+    Returns:
+        str: Motivo por el que el escenario es infactible, o None si no se detectó ninguno.
+    """
+    Q, U, D, B, V = (parametros[k] for k in ("Q", "U", "D", "B", "V"))
+    dias = parametros["dias"]
+    turnos = parametros["turnos"]  # Las tablas pueden traer turnos que no están en la grilla
+    turnos_por_dia = parametros["turnos_por_dia"]
+    H, Hmax = parametros["H"], parametros["Hmax"]
+
+    dias_trabajables = len(dias) - cantidad_de_francos
+    if dias_trabajables < 0:
+        return f"{cantidad_de_francos} francos superan los {len(dias)} días de la grilla"
+
+    # Demanda total vs. turnos totales a asignar: cada turno asignado cubre un lugar.
+    if sum(Q[t] for t in turnos) > sum(U.values()):
+        return "La demanda total supera la suma de turnos deseados"
+
+    for t in turnos:
+        demanda = Q[t]
+        disponibles = sum(D[t][e] for e in empleados)
+        if demanda > disponibles:
+            return f"{t}: se necesitan {demanda} empleados y hay {disponibles} disponibles"
+        for r in roles:
+            calificados = sum(D[t][e] * B[r][e] for e in empleados)
+            if V[t][r] > calificados:
+                return f"{t}: se necesitan {V[t][r]} '{r}' y hay {calificados} disponibles"
+
+    for r in roles:
+        if sum(V[t][r] for t in turnos) > sum(U[e] for e in empleados if B[r][e]):
+            return f"Los turnos deseados de quienes pueden ser '{r}' no alcanzan para cubrir el rol"
+
+    for e in empleados:
+        # Cada día trabajado aporta un turno; los días dobles aportan además los turnos extra
+        # que permiten la disponibilidad y el máximo por día (ignorando solapamientos).
+        dias_disponibles = 0
+        extras = []
+        for m in dias:
+            disponibles_dia = sum(D[t][e] for t in turnos_por_dia[m])
+            if max_turnos_por_dia is not None:
+                disponibles_dia = min(disponibles_dia, max_turnos_por_dia)
+            if disponibles_dia > 0:
+                dias_disponibles += 1
+                extras.append(disponibles_dia - 1)
+        dias_trabajados = min(dias_disponibles, dias_trabajables)
+        extras = sorted(extras, reverse=True)[:min(cantidad_de_dobles, dias_trabajados)]
+        maximo = dias_trabajados + sum(extras)
+        if U[e] > maximo:
+            return f"{e} no puede hacer {U[e]} turnos (máximo {maximo} con estas restricciones)"
+
+        if Hmax[e] is not None:
+            horas_minimas = sum(sorted(H[t] for t in turnos if D[t][e])[:U[e]])
+            if horas_minimas > Hmax[e]:
+                return f"{e} necesita al menos {horas_minimas:g} horas para sus {U[e]} turnos (máximo {Hmax[e]:g})"
+
+    return None
+
+
+def _resolver_escenario(argumentos):
+    empleados, roles, parametros, francos, dobles, tiempo_limite, max_turnos_por_dia = argumentos
+    return resolver_desde_parametros(
+        empleados, roles, parametros, francos, dobles, tiempo_limite, max_turnos_por_dia
+    )
+
+
+def barrido_escenarios(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    francos_valores: list,
+    dobles_valores: list,
+    deltas_demanda: list = (0,),
+    max_procesos: int = None,
+    tiempo_limite: float = None,
+    max_turnos_por_dia: int = None
+):
+    """
+    Resuelve en paralelo todas las combinaciones de francos, dobles y ajuste de demanda.
+
+    Los parámetros se preparan una sola vez (con `preparar_parametros`) y cada variante
+    se construye y resuelve en un proceso del pool. Las combinaciones que no pasan
+    `chequeo_rapido` se marcan como descartadas sin llamar al solver.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        francos_valores (list): Valores de `cantidad_de_francos` a probar.
+        dobles_valores (list): Valores de `cantidad_de_dobles` a probar.
+        deltas_demanda (list): Ajustes a sumar a 'Empleados Necesarios' de cada turno (ej: [-1, 0, 1]).
+        max_procesos (int): Cantidad máxima de procesos (None = cantidad de CPUs).
+        tiempo_limite (float): Tiempo máximo de resolución por escenario en segundos.
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+
+    Returns:
+        pd.DataFrame: Una fila por escenario con su estado, objetivo, 'aux', tiempo de resolución y
+            cantidad de asignaciones fijadas por el presolve.
+    """
+    filas = []
+    pendientes = []
+    for francos, dobles, delta in itertools.product(francos_valores, dobles_valores, deltas_demanda):
+        parametros_escenario = ajustar_demanda(parametros, delta)
+        fila = {
+            "Francos": francos,
+            "Dobles": dobles,
+            "Ajuste Demanda": delta,
+            "Estado": "Descartado",
+            "Objetivo": None,
+            "Aux": None,
+            "Tiempo (s)": 0.0,
+            "Fijadas por Presolve": None,
+            "Motivo": chequeo_rapido(
+                empleados, roles, parametros_escenario, francos, dobles, max_turnos_por_dia
+            )
+        }
+        filas.append(fila)
+        if fila["Motivo"] is None:
+            pendientes.append((
+                fila,
+                (empleados, roles, parametros_escenario, francos, dobles, tiempo_limite, max_turnos_por_dia)
+            ))
+
+    if pendientes:
+        with ProcessPoolExecutor(max_workers=max_procesos) as executor:
+            resultados = executor.map(_resolver_escenario, [argumentos for _, argumentos in pendientes])
+            for (fila, _), resultado in zip(pendientes, resultados):
+                fila["Estado"] = resultado["estado"]
+                fila["Objetivo"] = resultado["objetivo"]
+                fila["Aux"] = resultado["aux"]
+                fila["Tiempo (s)"] = round(resultado["tiempo"], 3)
+                fila["Fijadas por Presolve"] = resultado["presolve"]["x_fijadas"]
+                fila["Motivo"] = ""
+
+    return pd.DataFrame(filas)
@@ -1,6 +1,116 @@
+import heapq
+from time import perf_counter
+
 import pandas as pd
 from pulp import *
 
+from presolve import propagar
+from cotas import alcanza_cota, cota_inferior
+from carrera import solucion_greedy, cargar_solucion
+
+
+DIAS = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+TURNOS_DIA = ["TM", "TT"] # Turno Mañana, Turno Tarde
+HORARIOS_DIA = {"TM": (8, 16), "TT": (16, 24)} # Horario (inicio, fin) de la grilla por defecto
+
+
+def grilla_turnos_por_defecto():
+    """
+    Devuelve la grilla de turnos clásica: todos los días de la semana con TM (8 a 16) y TT (16 a 24).
+
+    Returns:
+        pd.DataFrame: Grilla con 'Turno' como índice y columnas 'Día', 'Inicio', 'Fin' y 'Horas'.
+    """
+    filas = [
+        {
+            "Turno": f"{day} {shift}",
+            "Día": day,
+            "Inicio": HORARIOS_DIA[shift][0],
+            "Fin": HORARIOS_DIA[shift][1],
+            "Horas": HORARIOS_DIA[shift][1] - HORARIOS_DIA[shift][0]
+        }
+        for day in DIAS for shift in TURNOS_DIA
+    ]
+    return pd.DataFrame(filas).set_index("Turno")
+
+
+def indices_grilla(grilla_turnos_df: pd.DataFrame):
+    """
+    Precalcula los índices de la grilla de turnos que usa el modelo.
+
+    Los horarios se pasan a horas absolutas de la semana (día * 24 + hora), por lo que un
+    turno nocturno con 'Fin' mayor a 24 se superpone con los primeros turnos del día siguiente.
+
+    Args:
+        grilla_turnos_df (pd.DataFrame): Grilla con 'Turno' como índice y columnas 'Día',
+            'Inicio' y 'Fin' (horas del día, ej: 22 a 30 para un turno noche) y, opcionalmente,
+            'Horas' (si falta o está vacía se usa Fin - Inicio).
+
+    Returns:
+        dict: Diccionario con
+            - 'dias' (list): Días en orden de aparición.
+            - 'turnos' (list): Turnos en orden de aparición.
+            - 'turnos_por_dia' (dict): Día -> lista de turnos del día.
+            - 'solapados' (dict): Turno -> lista de turnos cuyos horarios se superponen con él.
+            - 'grupos_solapados' (dict): Turno -> turnos en curso en el momento en que empieza
+              (incluido él), para cada inicio con al menos dos turnos en curso. Dos turnos se
+              superponen sólo si ambos están en curso al empezar el último, así que alcanza con
+              un grupo por inicio para excluir todos los pares.
+            - 'horarios' (dict): Turno -> (inicio, fin) en horas absolutas de la semana.
+            - 'H' (dict): Turno -> horas trabajadas en el turno.
+
+    Raises:
+        ValueError: Si algún turno no tiene día, inicio o fin.
+    """
+    incompletos = grilla_turnos_df.index[grilla_turnos_df[["Día", "Inicio", "Fin"]].isna().any(axis=1)]
+    if len(incompletos) > 0:
+        raise ValueError(f"Turnos sin día, inicio o fin en la grilla: {list(incompletos)}")
+
+    turnos = list(grilla_turnos_df.index)
+    dias = list(dict.fromkeys(grilla_turnos_df["Día"]))
+    turnos_por_dia = {m: [] for m in dias}
+    H = {}
+    horarios = {}
+    intervalos = []
+    for t, fila in grilla_turnos_df.iterrows():
+        turnos_por_dia[fila["Día"]].append(t)
+        horas = fila["Horas"] if "Horas" in fila and pd.notna(fila["Horas"]) else fila["Fin"] - fila["Inicio"]
+        H[t] = float(horas)
+        base = dias.index(fila["Día"]) * 24
+        horarios[t] = (float(base + fila["Inicio"]), float(base + fila["Fin"]))
+        intervalos.append((base + fila["Inicio"], base + fila["Fin"], t))
+
+    # Barrido ordenado por inicio: cada turno sólo se compara con los que empiezan antes de que termine
+    solapados = {t: [] for t in turnos}
+    intervalos.sort()
+    for i, (inicio_i, fin_i, t_i) in enumerate(intervalos):
+        for inicio_j, fin_j, t_j in intervalos[i + 1:]:
+            if inicio_j >= fin_i:
+                break
+            solapados[t_i].append(t_j)
+            solapados[t_j].append(t_i)
+
+    # Mismo barrido con los turnos en curso (montículo por fin): un grupo por cada inicio distinto
+    posicion = {t: i for i, t in enumerate(turnos)}
+    grupos_solapados = {}
+    en_curso = []
+    for i, (inicio, fin, t) in enumerate(intervalos):
+        while en_curso and en_curso[0][0] <= inicio:
+            heapq.heappop(en_curso)
+        heapq.heappush(en_curso, (fin, t))
+        ultimo_con_este_inicio = i + 1 == len(intervalos) or intervalos[i + 1][0] != inicio
+        if ultimo_con_este_inicio and len(en_curso) >= 2:
+            grupos_solapados[t] = sorted((s for _, s in en_curso), key=posicion.get)
+
+    return {
+        "dias": dias,
+        "turnos": turnos,
+        "turnos_por_dia": turnos_por_dia,
+        "solapados": solapados,
+        "grupos_solapados": grupos_solapados,
+        "horarios": horarios,
+        "H": H
+    }
 
 
 def resolver_planificacion_turnos(
@@ -12,7 +122,10 @@ def resolver_planificacion_turnos(
     turnos_deseados_df: pd.DataFrame,      # Datos de la Sección 6 (Turnos Deseados por Empleado)
     total_requerimientos_df: pd.DataFrame,  # Datos de la Sección 7 (Requisitos Totales de Empleados por Turno)
     cantidad_de_francos: int = 1, # Cantidad de días de descanso por empleado (default: 1)
-    cantidad_de_dobles: int = 1   # Cantidad de días con doble turno por empleado (default: 1)
+    cantidad_de_dobles: int = 1,  # Cantidad de días con doble turno por empleado (default: 1)
+    grilla_turnos_df: pd.DataFrame = None, # Grilla de turnos (default: TM y TT todos los días)
+    max_turnos_por_dia: int = None, # Cantidad máxima de turnos por día por empleado (default: sin límite)
+    presolve: bool = True # Fijar por propagación las asignaciones forzadas antes de resolver (default: sí)
 ):
     """
     Construye y resuelve el modelo de planificación de turnos utilizando PuLP.
@@ -25,6 +138,13 @@ def resolver_planificacion_turnos(
         requisitos_roles_df (pd.DataFrame): DataFrame con la cantidad de roles necesarios por turno.
         turnos_deseados_df (pd.DataFrame): DataFrame con la cantidad de turnos deseados por empleado.
         total_requerimientos_df (pd.DataFrame): DataFrame con el total de empleados necesarios por turno.
+        cantidad_de_francos (int): Cantidad mínima de días de descanso por empleado.
+        cantidad_de_dobles (int): Cantidad máxima de días con más de un turno por empleado.
+        grilla_turnos_df (pd.DataFrame): Grilla de turnos (ver `indices_grilla`). Por defecto,
+            la de `grilla_turnos_por_defecto`.
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+        presolve (bool): Si es True, las asignaciones forzadas se fijan con `presolve.propagar`
+            y sólo el resto se pasa al solver.
 
     Returns:
         tuple: Una tupla que contiene:
@@ -40,11 +160,6 @@ def resolver_planificacion_turnos(
             - U_val (dict): Parámetro de turnos deseados por empleado.
             - dias_zimpl_indices (list): Lista de índices numéricos para los días.
     """
-    days = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-    shifts = ["TM", "TT"] # Turno Mañana, Turno Tarde
-    turnos = [f"{day} {shift}" for day in days for shift in shifts]
-
-
     pd.set_option('display.max_rows', None)
     pd.set_option('display.max_columns', None)
     pd.set_option('display.width', None)
@@ -62,6 +177,68 @@ def resolver_planificacion_turnos(
     print("************************************** CHEQUEAR *********************************************")
 
 
+    parametros = preparar_parametros(
+        habilidades_df,
+        preferencias_df,
+        requisitos_roles_df,
+        turnos_deseados_df,
+        total_requerimientos_df,
+        grilla_turnos_df
+    )
+    fijaciones = None
+    if presolve:
+        fijaciones = propagar(
+            empleados, roles, parametros, cantidad_de_francos, cantidad_de_dobles, max_turnos_por_dia
+        )
+    prob, x, y, w, z, aux = construir_modelo(
+        empleados,
+        roles,
+        parametros,
+        cantidad_de_francos,
+        cantidad_de_dobles,
+        max_turnos_por_dia,
+        fijaciones
+    )
+
+    return prob, x, y, w, z, aux, parametros["P"], parametros["B"], parametros["Q"], parametros["U"]
+
+
+def preparar_parametros(
+    habilidades_df: pd.DataFrame,
+    preferencias_df: pd.DataFrame,
+    requisitos_roles_df: pd.DataFrame,
+    turnos_deseados_df: pd.DataFrame,
+    total_requerimientos_df: pd.DataFrame,
+    grilla_turnos_df: pd.DataFrame = None
+):
+    """
+    Convierte los DataFrames de entrada en los diccionarios de parámetros del modelo.
+
+    El resultado sólo contiene tipos básicos de Python (diccionarios, listas y números),
+    por lo que puede reutilizarse para construir varias variantes del modelo o
+    enviarse a otros procesos sin volver a leer los DataFrames.
+
+    Args:
+        habilidades_df (pd.DataFrame): DataFrame con habilidades de los empleados para los roles.
+        preferencias_df (pd.DataFrame): DataFrame con preferencias de turnos por empleado.
+        requisitos_roles_df (pd.DataFrame): DataFrame con la cantidad de roles necesarios por turno.
+        turnos_deseados_df (pd.DataFrame): DataFrame con la cantidad de turnos deseados por empleado.
+        total_requerimientos_df (pd.DataFrame): DataFrame con el total de empleados necesarios por turno.
+            Si `turnos_deseados_df` tiene la columna opcional 'Horas Máximas', se usa como límite de
+            horas semanales por empleado (vacío = sin límite).
+        grilla_turnos_df (pd.DataFrame): Grilla de turnos (ver `indices_grilla`). Por defecto,
+            la de `grilla_turnos_por_defecto`.
+
+    Returns:
+        dict: Diccionario con los parámetros 'Q', 'U', 'P', 'D', 'B', 'V' y 'Hmax', más los
+            índices de la grilla calculados por `indices_grilla`.
+
+    Raises:
+        ValueError: Si algún turno de la grilla no tiene preferencias o requerimientos cargados.
+    """
+    if grilla_turnos_df is None:
+        grilla_turnos_df = grilla_turnos_por_defecto()
+
     # --- 1. Definición de Parámetros (desde los DataFrames) ---
 
     # PARAMETRO Q[Turnos]: Cuántos empleados necesito en cada turno (total)
@@ -74,6 +251,14 @@ def resolver_planificacion_turnos(
     # Convertimos a un diccionario: U_val['Juan'] = 5
     U = turnos_deseados_df['Turnos Deseados'].to_dict()
 
+    # PARAMETRO Hmax[Empleados]: Cuántas horas puede trabajar como máximo cada empleado (None = sin límite)
+    Hmax = {e: None for e in U}
+    if 'Horas Máximas' in turnos_deseados_df.columns:
+        Hmax = {
+            e: (float(h) if pd.notna(h) else None)
+            for e, h in turnos_deseados_df['Horas Máximas'].items()
+        }
+
         # PARAMETRO D[Turnos*Empleados]: Si el empleado E está disponible en el turno T (0 o 1)
     # PARAMETRO P[Turnos*Empleados]: Preferencias de turnos para los empleados (0-5, donde menor es mejor).
     # Ahora, P mantiene el valor tal cual (0-5), y D indica disponibilidad (0 o 1).
@@ -98,7 +283,55 @@ def resolver_planificacion_turnos(
     B = habilidades_df.T.astype(int).to_dict(orient='dict')
 
     V= requisitos_roles_df.to_dict()
-   
+
+    grilla = indices_grilla(grilla_turnos_df)
+    faltantes = [t for t in grilla["turnos"] if t not in Q or t not in P or t not in V]
+    if faltantes:
+        raise ValueError(f"Faltan preferencias o requerimientos para los turnos: {', '.join(faltantes)}")
+
+    return dict(grilla, Q=Q, U=U, P=P, D=D, B=B, V=V, Hmax=Hmax)
+
+
+def construir_modelo(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int = 1,
+    cantidad_de_dobles: int = 1,
+    max_turnos_por_dia: int = None,
+    fijaciones: dict = None
+):
+    """
+    Construye el modelo de planificación de turnos a partir de parámetros ya preparados.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        cantidad_de_francos (int): Cantidad mínima de días de descanso por empleado.
+        cantidad_de_dobles (int): Cantidad máxima de días con más de un turno por empleado.
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+        fijaciones (dict): Resultado de `presolve.propagar`. Las variables fijadas se acotan a su
+            valor (el presolve de CBC las quita del modelo). Si la propagación encontró el modelo
+            infactible se ignoran, para que el solver informe el estado.
+
+    Returns:
+        tuple: (prob, x, y, w, z, aux), el problema sin resolver y sus variables.
+    """
+    days = parametros["dias"]
+    turnos = parametros["turnos"]
+    turnos_por_dia = parametros["turnos_por_dia"]
+    grupos_solapados = parametros["grupos_solapados"]
+    H = parametros["H"]
+    Hmax = parametros["Hmax"]
+
+    Q = parametros["Q"]
+    U = parametros["U"]
+    P = parametros["P"]
+    D = parametros["D"]
+    B = parametros["B"]
+    V = parametros["V"]
+
 
     # --- 2. Definición del Problema de Optimización con PuLP ---
     prob = LpProblem("Planificacion_Turnos", LpMinimize)
@@ -107,7 +340,7 @@ def resolver_planificacion_turnos(
     # x[Turnos*Empleados] binary; # 1 si el empleado E trabaja en el turno T
     x = LpVariable.dicts("Trabaja", (turnos, empleados), 0, 1, LpBinary)
 
-    # y[Dias*Empleados] binary; # 1 si el empleado E trabaja en el dia M (TM o TT o ambos)
+    # y[Dias*Empleados] binary; # 1 si el empleado E trabaja en el dia M (en alguno de sus turnos)
     # Indexado por los números de día de ZIMPL (0, 2, ...)
     y = LpVariable.dicts("TrabajaDia", (days, empleados), 0, 1, LpBinary)
 
@@ -115,13 +348,23 @@ def resolver_planificacion_turnos(
     # Indexado por los números de día de ZIMPL
     w = LpVariable.dicts("DescansaDia", (days, empleados), 0, 1, LpBinary)
 
-    # z[Dias*Empleados] binary; # 1 si el empleado E hace doble turno el dia M (TM y TT)
+    # z[Dias*Empleados] binary; # 1 si el empleado E hace doble turno el dia M (más de un turno)
     # Indexado por los números de día de ZIMPL
     z = LpVariable.dicts("DobleTurno", (days, empleados), 0, 1, LpBinary)
 
     # aux integer; # Variable auxiliar para balancear el mínimo de turnos asignados
     aux = LpVariable("AuxiliarMinTurnos", lowBound=0  ,cat='Integer')
 
+    # Asignaciones ya decididas por el presolve: las variables quedan acotadas a su valor
+    if fijaciones is not None and fijaciones["infactible"] is None:
+        for (t, e), valor in fijaciones["x"].items():
+            x[t][e].bounds(valor, valor)
+        for (m, e), valor in fijaciones["y"].items():
+            y[m][e].bounds(valor, valor)
+            w[m][e].bounds(1 - valor, 1 - valor)
+        for (m, e), valor in fijaciones["z"].items():
+            z[m][e].bounds(valor, valor)
+
     # --- 4. Función Objetivo ---
     # minimize cost: sum <t> in Turnos: sum <e> in Empleados: x[t,e] * P[t,e] + aux;
     # La restricción D[t,e] >= x[t,e] asegurará que x[t,e] será 0 si D[t,e] es 0 (indisponible).
@@ -150,31 +393,36 @@ def resolver_planificacion_turnos(
         prob += lpSum(x[t][e] for e in empleados) >= Q[t], f"Cubrir_demanda_total_{t}"
 
 
-    # --- Restricciones de DOBLE TURNO (z) ---
-    # ligar_variable4 y ligar_variable5:
-    # z[m, e] es 1 si el empleado E trabaja en el turno 'm' (TM) y 'm+1' (TT) del mismo día.
-    # Aquí 'm' son los índices numéricos de días de ZIMPL (0, 2, ...)
-    for m in days: # Itera a través de los índices de turnos de mañana (0, 2, ..., 12)
-        t_tm_str = f'{m} TM'  # Nombre del turno de la mañana (ej: "Lunes TM")
-        t_tt_str = f'{m} TT' # Nombre del turno de la tarde (ej: "Lunes TT")
+    # --- Restricciones por DÍA (y, z) ---
+    # Se recorren los turnos de cada día con el índice precalculado `turnos_por_dia`,
+    # así la cantidad de restricciones crece linealmente con la cantidad de turnos.
+    for m in days:
+        turnos_m = turnos_por_dia[m]
+        n = len(turnos_m)
 
         for e in empleados:
-            # z[m][e] = 1 si x[t_tm_str][e] y x[t_tt_str][e] son 1 (trabaja ambos turnos)
-            prob += z[m][e] <= x[t_tm_str][e], f"DobleTurno_def_1_{m}_{e}"
-            prob += z[m][e] <= x[t_tt_str][e], f"DobleTurno_def_2_{m}_{e}"
-            prob += x[t_tm_str][e] + x[t_tt_str][e] <= z[m][e] + 1, f"DobleTurno_def_3_{m}_{e}"
+            trabajados = lpSum(x[t][e] for t in turnos_m)
+
+            # ligar_variable1 y ligar_variable2:
+            # y[m, e] es 1 si el empleado E trabaja en CUALQUIER turno del día 'm'.
+            prob += n * y[m][e] >= trabajados, f"TrabajaDia_def_1_{m}_{e}"
+            prob += y[m][e] <= trabajados, f"TrabajaDia_def_2_{m}_{e}"
+
+            # ligar_variable4 y ligar_variable5:
+            # z[m, e] es 1 si el empleado E trabaja más de un turno del día 'm' (doble turno).
+            prob += 2 * z[m][e] <= trabajados, f"DobleTurno_def_1_{m}_{e}"
+            prob += trabajados - 1 <= (n - 1) * z[m][e], f"DobleTurno_def_2_{m}_{e}"
 
+            if max_turnos_por_dia is not None and n > max_turnos_por_dia:
+                prob += trabajados <= max_turnos_por_dia, f"Max_turnos_dia_{m}_{e}"
 
-    # --- Restricciones de UN FRANCO (y, w) ---
-    # ligar_variable1 y ligar_variable2:
-    # y[m, e] es 1 si el empleado E trabaja en CUALQUIER turno (TM o TT) del día 'm'.
-    for m in days: # Itera a través de los índices de turnos de mañana (0, 2, ..., 12)
-        t_tm_str = f'{m} TM'  # Nombre del turno de la mañana (ej: "Lunes TM")
-        t_tt_str = f'{m} TT' # Nombre del turno de la tarde (ej: "Lunes TT")
 
+    # --- Restricciones de SOLAPAMIENTO ---
+    # Un empleado no puede trabajar dos turnos cuyos horarios se superponen: en cada inicio de
+    # turno, a lo sumo uno de los turnos en curso. Una restricción por inicio y empleado.
+    for t, grupo in grupos_solapados.items():
         for e in empleados:
-            prob += y[m][e] >= (x[t_tm_str][e] + x[t_tt_str][e]) / 2, f"TrabajaDia_def_1_{m}_{e}"
-            prob += y[m][e] <= (x[t_tm_str][e] + x[t_tt_str][e]), f"TrabajaDia_def_2_{m}_{e}"
+            prob += lpSum(x[s][e] for s in grupo) <= 1, f"Solapamiento_{t}_{e}"
 
 
     # ligar_variable3: y[m, e] + w[m, e] == 1;
@@ -209,4 +457,112 @@ def resolver_planificacion_turnos(
     for e in empleados:
         prob += lpSum(x[t][e] for t in turnos) >= aux, f"Balanceo_min_turnos_{e}"
 
-    return prob, x, y, w, z, aux, P, B, Q, U
+
+    # --- Restricciones de HORAS ---
+    # La suma de horas de los turnos asignados no puede superar el máximo del empleado.
+    for e in empleados:
+        if Hmax[e] is not None:
+            prob += lpSum(H[t] * x[t][e] for t in turnos) <= Hmax[e], f"Horas_maximas_{e}"
+
+    return prob, x, y, w, z, aux
+
+
+def resolver_desde_parametros(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int = 1,
+    cantidad_de_dobles: int = 1,
+    tiempo_limite: float = None,
+    max_turnos_por_dia: int = None,
+    presolve: bool = True,
+    usar_cota: bool = True
+):
+    """
+    Construye y resuelve el modelo, devolviendo un resumen con tipos básicos de Python.
+
+    Pensado para ejecutarse en otros procesos (barridos de escenarios, servicios),
+    donde los objetos de PuLP no se devuelven al llamador.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        cantidad_de_francos (int): Cantidad mínima de días de descanso por empleado.
+        cantidad_de_dobles (int): Cantidad máxima de días con doble turno por empleado.
+        tiempo_limite (float): Tiempo máximo de resolución en segundos (None = sin límite).
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+        presolve (bool): Si es True, se fijan las asignaciones forzadas con `presolve.propagar`.
+        usar_cota (bool): Si es True, se calcula `cotas.cota_inferior` y el solver no se llama
+            cuando la cota demuestra que no hay solución o la solución de `carrera.solucion_greedy`
+            la alcanza.
+
+    Returns:
+        dict: Diccionario con 'estado', 'objetivo', 'aux', 'tiempo' (segundos, incluye el presolve),
+            'asignacion' (turno -> lista de empleados asignados), 'presolve' (estadísticas
+            de la propagación, o None), 'cota' (cota inferior usada, o None) y 'optimo_por_cota'
+            (True si la optimalidad la demuestra la cota y no el solver: la solución greedy la
+            alcanzó, o el solver llegó al tiempo límite con una solución que la alcanza).
+    """
+    inicio = perf_counter()
+    fijaciones = None
+    if presolve:
+        fijaciones = propagar(
+            empleados, roles, parametros, cantidad_de_francos, cantidad_de_dobles, max_turnos_por_dia
+        )
+    cota = None
+    if usar_cota:
+        cota = cota_inferior(
+            empleados, roles, parametros, cantidad_de_francos, cantidad_de_dobles, max_turnos_por_dia, fijaciones
+        )
+    prob, x, y, w, z, aux = construir_modelo(
+        empleados,
+        roles,
+        parametros,
+        cantidad_de_francos,
+        cantidad_de_dobles,
+        max_turnos_por_dia,
+        fijaciones
+    )
+
+    # La cota sólo evita llamar al solver: si demuestra que no hay solución, o si la solución
+    # greedy ya la alcanza. Cuando el solver termina, su propia cota es al menos tan buena.
+    optimo_por_cota = False
+    if cota == float("inf"):
+        prob.assignStatus(LpStatusInfeasible, LpSolutionInfeasible)
+    else:
+        asignacion_inicial = None
+        if cota is not None:
+            asignacion_inicial = solucion_greedy(
+                empleados, roles, parametros, cantidad_de_francos, cantidad_de_dobles, max_turnos_por_dia
+            )
+        if asignacion_inicial is not None:
+            cargar_solucion(asignacion_inicial, parametros, x, y, w, z, aux)
+            optimo_por_cota = prob.valid(1e-6) and alcanza_cota(value(prob.objective), cota)
+        if optimo_por_cota:
+            prob.assignStatus(LpStatusOptimal, LpSolutionOptimal)
+        else:
+            prob.solve(PULP_CBC_CMD(msg=False, timeLimit=tiempo_limite))
+            optimo_por_cota = (
+                prob.sol_status == LpSolutionIntegerFeasible and alcanza_cota(value(prob.objective), cota)
+            )
+    tiempo = perf_counter() - inicio
+
+    estado = LpStatus[prob.status]
+    resultado = {
+        "estado": estado,
+        "objetivo": None,
+        "aux": None,
+        "tiempo": tiempo,
+        "asignacion": {},
+        "presolve": fijaciones["estadisticas"] if fijaciones is not None else None,
+        "cota": cota if cota != float("inf") else None,
+        "optimo_por_cota": optimo_por_cota
+    }
+    if estado == "Optimal":
+        resultado["objetivo"] = value(prob.objective)
+        resultado["aux"] = value(aux)
+        resultado["asignacion"] = {
+            t: [e for e in empleados if value(x[t][e]) > 0.5] for t in x
+        }
+    return resultado
@@ -0,0 +1,175 @@
+class _Infactible(Exception):
+    """La propagación encontró una contradicción: el modelo no tiene solución."""
+
+
+def propagar(
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int = 1,
+    cantidad_de_dobles: int = 1,
+    max_turnos_por_dia: int = None
+):
+    """
+    Fija por propagación lógica las asignaciones que están forzadas antes de llamar al solver.
+
+    Recorre los parámetros del modelo aplicando reglas simples y repite hasta que ninguna
+    regla fije nada nuevo:
+
+    - Turnos no disponibles (D = 0): x = 0.
+    - Empleado con exactamente U[e] turnos posibles: todos a 1. Con U[e] ya asignados: el resto a 0.
+    - Turno cuya demanda Q[t] es igual a los empleados posibles: todos a 1.
+    - Rol cuya demanda V[t][r] es igual a los calificados posibles: todos a 1.
+    - Turno asignado: los turnos que se superponen con él, a 0.
+    - Día con el máximo de turnos por día asignado, o con un turno asignado y sin doble
+      permitido: el resto de los turnos del día a 0.
+    - Empleado con todos sus días de trabajo ya usados (según los francos): el resto de los días a 0.
+    - Turno cuyas horas superan las horas que le quedan al empleado: x = 0.
+
+    Las variables de día (y, z) se fijan cuando sus turnos quedan decididos.
+
+    Args:
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros devueltos por `preparar_parametros`.
+        cantidad_de_francos (int): Cantidad mínima de días de descanso por empleado.
+        cantidad_de_dobles (int): Cantidad máxima de días con más de un turno por empleado.
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+
+    Returns:
+        dict: Diccionario con
+            - 'x' (dict): (turno, empleado) -> valor fijado (0 o 1).
+            - 'y' (dict): (día, empleado) -> valor fijado de la variable TrabajaDia.
+            - 'z' (dict): (día, empleado) -> valor fijado de la variable DobleTurno.
+            - 'infactible' (str): Motivo si se encontró una contradicción, o None.
+            - 'estadisticas' (dict): Cantidad de variables fijadas y de rondas. Si se encontró una
+              contradicción, las fijaciones no se usan y se informan 0 variables fijadas.
+    """
+    Q, U, D, B, V = (parametros[k] for k in ("Q", "U", "D", "B", "V"))
+    dias = parametros["dias"]
+    turnos = parametros["turnos"]
+    turnos_por_dia = parametros["turnos_por_dia"]
+    solapados = parametros["solapados"]
+    H, Hmax = parametros["H"], parametros["Hmax"]
+
+    fx, fy, fz = {}, {}, {}
+
+    def fijar(fijadas, clave, valor):
+        actual = fijadas.get(clave)
+        if actual is None:
+            fijadas[clave] = valor
+            return True
+        if actual != valor:
+            raise _Infactible(f"{clave} debería valer 0 y 1 a la vez")
+        return False
+
+    def separar(claves):
+        # Devuelve (cantidad fijada en 1, claves libres)
+        unos = sum(fx.get(k) == 1 for k in claves)
+        return unos, [k for k in claves if k not in fx]
+
+    infactible = None
+    rondas = 0
+    try:
+        for t in turnos:
+            for e in empleados:
+                if not D[t][e]:
+                    fijar(fx, (t, e), 0)
+
+        cambio = True
+        while cambio:
+            cambio = False
+            rondas += 1
+
+            for e in empleados:
+                unos, libres = separar([(t, e) for t in turnos])
+                if unos > U[e] or unos + len(libres) < U[e]:
+                    raise _Infactible(f"{e} no puede hacer exactamente {U[e]} turnos")
+                if libres and unos == U[e]:
+                    cambio |= any([fijar(fx, k, 0) for k in libres])
+                elif libres and unos + len(libres) == U[e]:
+                    cambio |= any([fijar(fx, k, 1) for k in libres])
+
+            for t in turnos:
+                unos, libres = separar([(t, e) for e in empleados])
+                if unos + len(libres) < Q[t]:
+                    raise _Infactible(f"{t} no alcanza los {Q[t]} empleados necesarios")
+                if libres and unos + len(libres) == Q[t]:
+                    cambio |= any([fijar(fx, k, 1) for k in libres])
+
+                for r in roles:
+                    unos, libres = separar([(t, e) for e in empleados if B[r][e]])
+                    if unos + len(libres) < V[t][r]:
+                        raise _Infactible(f"{t} no alcanza los {V[t][r]} '{r}' necesarios")
+                    if libres and unos + len(libres) == V[t][r]:
+                        cambio |= any([fijar(fx, k, 1) for k in libres])
+
+            for (t, e), valor in list(fx.items()):
+                if valor == 1:
+                    cambio |= any([fijar(fx, (s, e), 0) for s in solapados[t]])
+
+            for e in empleados:
+                dias_trabajados = 0
+                dias_posibles = []
+                dobles_usados = 0
+                for m in dias:
+                    unos, libres = separar([(t, e) for t in turnos_por_dia[m]])
+                    if max_turnos_por_dia is not None and unos >= max_turnos_por_dia:
+                        if unos > max_turnos_por_dia:
+                            raise _Infactible(f"{e} supera el máximo de turnos el {m}")
+                        cambio |= any([fijar(fx, k, 0) for k in libres])
+                        libres = []
+
+                    if unos >= 1:
+                        cambio |= fijar(fy, (m, e), 1)
+                        dias_trabajados += 1
+                    elif not libres:
+                        cambio |= fijar(fy, (m, e), 0)
+                    else:
+                        dias_posibles.append(libres)
+
+                    if unos >= 2:
+                        cambio |= fijar(fz, (m, e), 1)
+                        dobles_usados += 1
+                    elif unos + len(libres) <= 1:
+                        cambio |= fijar(fz, (m, e), 0)
+
+                # Francos: si ya trabaja todos los días permitidos, el resto de los días descansa
+                if dias_trabajados > len(dias) - cantidad_de_francos:
+                    raise _Infactible(f"{e} no llega a tener {cantidad_de_francos} francos")
+                if dias_trabajados == len(dias) - cantidad_de_francos:
+                    for libres in dias_posibles:
+                        cambio |= any([fijar(fx, k, 0) for k in libres])
+
+                # Dobles: si ya usó todos los dobles, los días con un turno asignado no admiten otro
+                if dobles_usados > cantidad_de_dobles:
+                    raise _Infactible(f"{e} supera los {cantidad_de_dobles} turnos dobles")
+                if dobles_usados == cantidad_de_dobles:
+                    for m in dias:
+                        if (m, e) not in fz:
+                            cambio |= fijar(fz, (m, e), 0)
+                        unos, libres = separar([(t, e) for t in turnos_por_dia[m]])
+                        if unos == 1:
+                            cambio |= any([fijar(fx, k, 0) for k in libres])
+
+                if Hmax[e] is not None:
+                    restantes = Hmax[e] - sum(H[t] for t in turnos if fx.get((t, e)) == 1)
+                    if restantes < 0:
+                        raise _Infactible(f"{e} supera sus {Hmax[e]:g} horas máximas")
+                    for t in turnos:
+                        if (t, e) not in fx and H[t] > restantes:
+                            cambio |= fijar(fx, (t, e), 0)
+    except _Infactible as e:
+        infactible = str(e)
+
+    # Con una contradicción el modelo se construye sin fijaciones (ver `construir_modelo`)
+    aplicadas = infactible is None
+    estadisticas = {
+        "x_total": len(turnos) * len(empleados),
+        "x_fijadas": len(fx) if aplicadas else 0,
+        "x_fijadas_en_1": sum(v == 1 for v in fx.values()) if aplicadas else 0,
+        "y_fijadas": len(fy) if aplicadas else 0,
+        "z_fijadas": len(fz) if aplicadas else 0,
+        "rondas": rondas
+    }
+    return {"x": fx, "y": fy, "z": fz, "infactible": infactible, "estadisticas": estadisticas}
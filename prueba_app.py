@@ -1,7 +1,13 @@
 import streamlit as st
 import pandas as pd
+import altair as alt
 from pulp import * # Se ha descomentado la importación de PuLP
-from modelo import resolver_planificacion_turnos # Asegúrate de que modelo.py está en el mismo directorio
+from modelo import construir_modelo, preparar_parametros, grilla_turnos_por_defecto # Asegúrate de que modelo.py está en el mismo directorio
+from escenarios import barrido_escenarios
+from presolve import propagar
+from carrera import solucion_greedy, cargar_solucion, resolver_en_carrera
+from sensibilidad import analizar_sensibilidad
+from cotas import cota_inferior
 from PIL import Image
 
 
@@ -24,13 +30,14 @@ st.markdown("Es mejor y mas comodo usar el sistema desde la computadora.")
 st.title("Sistema de Planificación de Turnos para tu Comercio")
 st.markdown("""
 El sistema esta destinado a comercios que trabajan todos los dias de la semana, con dos turnos por dia.
+Si tu comercio trabaja con otros turnos (por ejemplo, tres turnos o bloques por hora), puedes cambiar la grilla de turnos en la Sección 0.
 
 
 Esta aplicación te permite configurar los datos iniciales para la planificación de turnos.
 Luego, podrás ejecutar el **modelo de optimización** para generar una propuesta de horarios.
 
 **Pasos:**\n
-0. **Cantidad minima de feriados y cantidad maxima de turnos dobles por empleado**: Define las restricciones de feriados y turnos dobles.
+0. **Cantidad minima de feriados y cantidad maxima de turnos dobles por empleado**: Define las restricciones de feriados y turnos dobles, y la grilla de turnos.
 1.  **Nombres de los Empleados**: Define tu personal.
 2.  **Tipos de Roles**: Lista las funciones en tu comercio.
 3.  **Asignación de Roles por Empleado**: Indica qué roles puede desempeñar cada empleado.
@@ -62,6 +69,37 @@ dobles = st.number_input(
     help="Define la cantidad máxima de turnos dobles permitidos para cada empleado."
 )
 
+max_turnos_dia = st.number_input(
+    "Cantidad máxima de turnos por día por empleado (0 = sin límite)",
+    min_value=0,
+    value=0,
+    step=1,
+    help="Útil cuando el día tiene más de dos turnos o bloques por hora. Con 0 sólo se aplica el límite de turnos dobles."
+)
+max_turnos_por_dia = int(max_turnos_dia) if max_turnos_dia > 0 else None
+
+st.subheader("Grilla de Turnos")
+st.markdown("""
+Cada fila es un turno: su nombre, el día al que pertenece, la hora de inicio y fin (un turno noche
+puede terminar después de las 24, por ejemplo de 22 a 30) y las horas que cuenta. Un empleado no
+puede trabajar dos turnos cuyos horarios se superponen. Puedes agregar o borrar filas.
+""")
+
+edited_grid_df = st.data_editor(
+    grilla_turnos_por_defecto().reset_index(),
+    column_config={
+        'Turno': st.column_config.TextColumn('Turno', required=True),
+        'Día': st.column_config.TextColumn('Día', required=True),
+        'Inicio': st.column_config.NumberColumn('Inicio', min_value=0, max_value=48, format="%g"),
+        'Fin': st.column_config.NumberColumn('Fin', min_value=0, max_value=48, format="%g"),
+        'Horas': st.column_config.NumberColumn('Horas', min_value=0, format="%g"),
+    },
+    num_rows="dynamic",
+    hide_index=True,
+    use_container_width=True,
+)
+grilla_turnos_df = edited_grid_df.dropna(subset=['Turno', 'Día', 'Inicio', 'Fin']).drop_duplicates('Turno').set_index('Turno')
+
 st.header("1. Nombres de los Empleados")
 st.markdown("Por favor, ingresa el número de empleados y sus nombres.")
 
@@ -133,9 +171,7 @@ else:
 st.header("4. Horarios Disponibles de Empleados")
 st.markdown("Para cada empleado, ingresa su preferencia para cada horario (0 = No disponible, 1 = Le gusta mucho, 5 = Lo odia).")
 
-days = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-shifts = ["TM", "TT"]
-time_slots = [f"{day} {shift}" for day in days for shift in shifts]
+time_slots = list(grilla_turnos_df.index)
 
 if employee_names:
     availability_data = {}
@@ -196,7 +232,8 @@ st.markdown("Para cada empleado, especifica el número de turnos que debe realiz
 if employee_names:
     desired_shifts_data = {
         'Empleado': employee_names,
-        'Turnos Deseados': [1] * len(employee_names) # Valor por defecto
+        'Turnos Deseados': [1] * len(employee_names), # Valor por defecto
+        'Horas Máximas': [float('nan')] * len(employee_names) # Sin límite por defecto
     }
     desired_shifts_df = pd.DataFrame(desired_shifts_data).set_index('Empleado')
 
@@ -204,6 +241,10 @@ if employee_names:
         'Turnos Deseados': st.column_config.NumberColumn(
             'Turnos Deseados', min_value=0, step=1, format="%d",
             help="Número total de turnos que el empleado debe realizar."
+        ),
+        'Horas Máximas': st.column_config.NumberColumn(
+            'Horas Máximas', min_value=0, step=1, format="%g",
+            help="Horas semanales máximas según la grilla de turnos (vacío = sin límite)."
         )
     }
 
@@ -249,6 +290,21 @@ else:
 st.header("8. Ejecutar la Planificación de Turnos")
 st.markdown("Una vez que hayas configurado todos los datos, haz clic en el botón para generar la planificación optimizada.")
 
+modo_carrera = st.checkbox(
+    "Modo carrera",
+    value=False,
+    help="Ejecuta en paralelo varias configuraciones del solver (y una solución greedy inicial) y se queda con la primera que demuestra la solución óptima. Útil cuando la planificación tarda mucho."
+)
+
+tiempo_limite_carrera = st.number_input(
+    "Tiempo límite del modo carrera (segundos)",
+    min_value=1,
+    value=60,
+    step=1,
+    disabled=not modo_carrera,
+    help="Si ninguna configuración demuestra la solución óptima en este tiempo, se usa la mejor encontrada."
+)
+
 if st.button("Ejecutar Planificación"):
     # Comprobar que los datos esenciales estén presentes antes de ejecutar el modelo
     if (not st.session_state.get('employee_names') or
@@ -277,27 +333,75 @@ if st.button("Ejecutar Planificación"):
                 # Ya que en la app se usa .T al inicializar assignment_df, el edited_assignment_df ya viene traspuesto
                 # entonces no necesitamos transponerlo de nuevo aquí, simplemente se pasa como está.
 
-                # Llamar al modelo de optimización
-                # Asegúrate de que todas las variables que retorna el modelo sean capturadas
-                prob, x, y, w, z, aux, P, B, Q_val, U_val = resolver_planificacion_turnos(
-                    empleados,
-                    roles,
+                parametros = preparar_parametros(
                     habilidades_df,
                     preferencias_df,
                     requisitos_roles_df,
                     turnos_deseados_df,
                     total_requerimientos_df,
+                    grilla_turnos_df
+                )
+
+                # Asignaciones fijadas por el presolve y cota inferior del objetivo: se calculan una
+                # sola vez y son las mismas que usa el modelo y que se muestran en los resultados
+                fijaciones = propagar(
+                    empleados,
+                    roles,
+                    parametros,
                     feriados,
-                    dobles
+                    dobles,
+                    max_turnos_por_dia
                 )
+                cota = cota_inferior(empleados, roles, parametros, feriados, dobles, max_turnos_por_dia, fijaciones)
+
+                # Construir el modelo de optimización
+                prob, x, y, w, z, aux = construir_modelo(
+                    empleados,
+                    roles,
+                    parametros,
+                    feriados,
+                    dobles,
+                    max_turnos_por_dia,
+                    fijaciones
+                )
+                U_val = parametros["U"]
 
                 # Resolver el problema
-                prob.solve()
+                if modo_carrera:
+                    # La solución greedy, si existe, es la incumbente inicial de todas las configuraciones
+                    asignacion_inicial = solucion_greedy(empleados, roles, parametros, feriados, dobles, max_turnos_por_dia)
+                    if asignacion_inicial is not None:
+                        cargar_solucion(asignacion_inicial, parametros, x, y, w, z, aux)
+                    resumen_carrera = resolver_en_carrera(prob, tiempo_limite_carrera, cota=cota)
+                else:
+                    prob.solve()
 
                 # Mostrar el estado de la solución
                 st.subheader("Resultados de la Optimización")
                 st.write(f"**Estado de la solución:** `{LpStatus[prob.status]}`")
 
+                # Resumen del presolve: asignaciones decididas por propagación antes de llamar al solver
+                estadisticas = fijaciones["estadisticas"]
+                st.write(
+                    f"**Presolve:** se fijaron `{estadisticas['x_fijadas']}` de `{estadisticas['x_total']}` asignaciones "
+                    f"(`{estadisticas['x_fijadas_en_1']}` obligatorias) en `{estadisticas['rondas']}` rondas; "
+                    f"el solver sólo decidió las `{estadisticas['x_total'] - estadisticas['x_fijadas']}` restantes."
+                )
+                if fijaciones["infactible"]:
+                    st.write(f"**Motivo detectado por el presolve:** {fijaciones['infactible']}")
+                if cota == float("inf"):
+                    st.write("**Cota inferior del objetivo:** el cálculo de la cota demuestra que no hay solución.")
+                else:
+                    st.write(f"**Cota inferior del objetivo:** `{cota:.2f}`")
+
+                if modo_carrera:
+                    st.write(f"**Configuración ganadora:** `{resumen_carrera['ganador']}` en `{resumen_carrera['tiempo']:.2f}` segundos")
+                    if resumen_carrera['optimo_por_cota']:
+                        st.write("**Óptimo por cota:** la planificación ganadora alcanzó la cota inferior, así que es óptima sin esperar a que un solver lo demuestre.")
+                    elif LpStatus[prob.status] == "Optimal" and not resumen_carrera['optimo_probado']:
+                        st.warning("Se alcanzó el tiempo límite: se muestra la mejor planificación encontrada, que puede no ser la óptima.")
+                    st.dataframe(pd.DataFrame(resumen_carrera['resultados']).set_index('nombre'))
+
                 if LpStatus[prob.status] == "Optimal":
                     st.success("¡Planificación generada con éxito!")
                     st.write(f"**Costo Total (suma de preferencias + balanceo):** `{value(prob.objective):.2f}`")
@@ -306,15 +410,8 @@ if st.button("Ejecutar Planificación"):
                     # --- Visualización del Plan de Turnos Asignado ---
                     st.markdown("### Plan de Turnos Asignado")
 
-                    days = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-                    shifts = ["TM", "TT"] # Turno Mañana, Turno Tarde
-                    turnos = [f"{day} {shift}" for day in days for shift in shifts]
-                    schedule_data_display = {'Turno': turnos} # 'turnos' debe ser definido o importado
-                    
-                    # days y shifts son globales en app.py, por lo que turnos también lo es.
-                    days = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-                    shifts = ["TM", "TT"]
-                    turnos = [f"{day} {shift}" for day in days for shift in shifts]
+                    # Los turnos son los de la grilla de la Sección 0.
+                    turnos = list(grilla_turnos_df.index)
 
                     schedule_data_display = {'Turno': turnos}
                     for empleado in empleados:
@@ -342,6 +439,30 @@ if st.button("Ejecutar Planificación"):
                         })
                     st.dataframe(pd.DataFrame(assigned_shifts_summary).set_index("Empleado"))
 
+                    # --- Análisis de Sensibilidad ---
+                    st.markdown("### Costo Marginal de Aumentar los Requerimientos")
+                    st.markdown(
+                        "Estimación de cuánto aumentaría el costo total con un empleado más en un turno (columna *Total*), "
+                        "con un empleado más de un rol en un turno o con un turno deseado más para un empleado. "
+                        "Se calcula con una sola resolución lineal sobre la planificación obtenida, por lo que es "
+                        "aproximada: para confirmar un cambio, vuelve a ejecutar la planificación."
+                    )
+                    sensibilidad = analizar_sensibilidad(
+                        prob, empleados, roles, parametros, feriados, dobles, max_turnos_por_dia
+                    )
+                    costos_df = pd.concat([sensibilidad['por_turno'].rename('Total'), sensibilidad['por_turno_rol']], axis=1)
+                    costos_largo = costos_df.reset_index(names='Turno').melt(
+                        id_vars='Turno', var_name='Requerimiento', value_name='Costo Marginal'
+                    )
+                    mapa_de_calor = alt.Chart(costos_largo).mark_rect().encode(
+                        x=alt.X('Requerimiento:N', sort=list(costos_df.columns), title=None),
+                        y=alt.Y('Turno:N', sort=turnos),
+                        color=alt.Color('Costo Marginal:Q', scale=alt.Scale(scheme='orangered')),
+                        tooltip=['Turno', 'Requerimiento', alt.Tooltip('Costo Marginal:Q', format='.2f')]
+                    )
+                    st.altair_chart(mapa_de_calor, use_container_width=True)
+                    st.dataframe(sensibilidad['por_empleado'].to_frame("Costo Marginal de un Turno Deseado Más"))
+
                 elif LpStatus[prob.status] == "Infeasible":
                     st.error("El modelo de optimización encontró que no es posible generar una planificación que cumpla con todas las restricciones dadas. Por favor, revisa tus requisitos de entrada (disponibilidades, habilidades, turnos deseados, requisitos de roles y totales) e intenta relajar algunas.")
                 else:
@@ -351,6 +472,70 @@ if st.button("Ejecutar Planificación"):
                 st.error(f"Ocurrió un error al ejecutar el modelo: {e}. Por favor, verifica tus datos de entrada y el archivo `modelo.py`.")
 
 
+st.header("9. Análisis de Escenarios")
+st.markdown("""
+Compara cómo cambian el costo y el balanceo al variar los feriados, los turnos dobles y la
+cantidad de empleados necesarios por turno. Todas las combinaciones se resuelven en paralelo;
+las que son claramente imposibles se descartan sin ejecutar el modelo.
+""")
+
+francos_escenarios = st.multiselect(
+    "Cantidades mínimas de feriados a probar",
+    options=list(range(0, 8)),
+    default=[int(feriados)],
+    help="Cada valor se combina con todos los valores de turnos dobles y de ajuste de demanda."
+)
+
+dobles_escenarios = st.multiselect(
+    "Cantidades máximas de turnos dobles a probar",
+    options=list(range(0, 8)),
+    default=[int(dobles)],
+)
+
+deltas_escenarios = st.multiselect(
+    "Ajustes a los Empleados Necesarios de cada turno",
+    options=[-2, -1, 0, 1, 2],
+    default=[-1, 0, 1],
+    help="Se suma este valor a los 'Empleados Necesarios' de todos los turnos (Sección 7)."
+)
+
+if st.button("Ejecutar Escenarios"):
+    if (not st.session_state.get('employee_names') or
+        not st.session_state.get('roles') or
+        st.session_state.get('edited_assignment_df') is None or
+        st.session_state.get('edited_availability_df') is None or
+        st.session_state.get('edited_role_requirements_df') is None or
+        st.session_state.get('edited_desired_shifts_df') is None or
+        st.session_state.get('edited_total_requirements_df') is None):
+        st.error("Por favor, completa todas las secciones de entrada de datos antes de ejecutar los escenarios.")
+    elif not (francos_escenarios and dobles_escenarios and deltas_escenarios):
+        st.error("Elige al menos un valor de feriados, de turnos dobles y de ajuste de demanda.")
+    else:
+        with st.spinner('Resolviendo los escenarios... esto puede tardar un momento.'):
+            try:
+                parametros = preparar_parametros(
+                    st.session_state['edited_assignment_df'].T,
+                    st.session_state['edited_availability_df'],
+                    st.session_state['edited_role_requirements_df'].T,
+                    st.session_state['edited_desired_shifts_df'],
+                    st.session_state['edited_total_requirements_df'],
+                    grilla_turnos_df
+                )
+                comparacion_df = barrido_escenarios(
+                    st.session_state['employee_names'],
+                    st.session_state['roles'],
+                    parametros,
+                    sorted(francos_escenarios),
+                    sorted(dobles_escenarios),
+                    sorted(deltas_escenarios),
+                    max_turnos_por_dia=max_turnos_por_dia
+                )
+                st.subheader("Comparación de Escenarios")
+                st.dataframe(comparacion_df, hide_index=True, use_container_width=True)
+            except Exception as e:
+                st.error(f"Ocurrió un error al ejecutar los escenarios: {e}. Por favor, verifica tus datos de entrada.")
+
+
 
 
 st.markdown("""
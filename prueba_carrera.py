@@ -0,0 +1,104 @@
+from pulp import *
+
+from modelo import construir_modelo, resolver_desde_parametros
+from presolve import propagar
+from cotas import alcanza_cota, cota_inferior
+from carrera import solucion_greedy, cargar_solucion, resolver_en_carrera
+from datos_prueba import empleados_test, roles_test, escenario_test
+from servicio import parametros_desde_json
+
+
+# --- 1. Escenario de prueba ---
+# Caj LV sólo puede las mañanas de lunes a jueves y quiere 4 turnos: el presolve los fija en 1
+MANANAS_CAJ_LV = ("Lunes TM", "Martes TM", "Miércoles TM", "Jueves TM")
+escenario_carrera = dict(escenario_test, preferencias={
+    turno: dict(preferencias, **{"Caj LV": 3 if turno in MANANAS_CAJ_LV else 0})
+    for turno, preferencias in escenario_test["preferencias"].items()
+})
+
+
+# --- 2. Carrera y resolución directa deben coincidir, con y sin cota inferior ---
+def construir(parametros, fijaciones):
+    return construir_modelo(empleados_test, roles_test, parametros, 1, 1, None, fijaciones)
+
+
+def carrera(parametros, fijaciones, cota=None):
+    prob, x, y, w, z, aux = construir(parametros, fijaciones)
+    asignacion_inicial = solucion_greedy(empleados_test, roles_test, parametros, 1, 1)
+    if asignacion_inicial is not None:
+        cargar_solucion(asignacion_inicial, parametros, x, y, w, z, aux)
+    resumen = resolver_en_carrera(prob, 30, cota=cota)
+    print(f"Carrera: ganador {resumen['ganador']}, {resumen['estado']}, objetivo: {resumen['objetivo']}")
+    for resultado in resumen["resultados"]:
+        print(f"    {resultado}")
+    return prob, x, resumen
+
+
+if __name__ == "__main__":
+    parametros = parametros_desde_json(escenario_carrera)[2]
+    fijaciones = propagar(empleados_test, roles_test, parametros, 1, 1)
+    print(f"Presolve: {fijaciones['estadisticas']}")
+    assert fijaciones["estadisticas"]["x_fijadas_en_1"] > 0
+
+    prob_directo, *_ = construir(parametros, fijaciones)
+    prob_directo.solve(PULP_CBC_CMD(msg=False))
+    objetivo_directo = value(prob_directo.objective)
+    print(f"prob.solve(): {LpStatus[prob_directo.status]}, objetivo: {objetivo_directo}")
+
+    prob, x, resumen = carrera(parametros, fijaciones)
+
+    assert all(x[t][e].varValue == valor for (t, e), valor in fijaciones["x"].items())
+    assert resumen["estado"] == LpStatus[prob_directo.status] == "Optimal"
+    assert resumen["optimo_probado"]
+    assert abs(resumen["objetivo"] - objetivo_directo) < 1e-6
+    assert abs(value(prob.objective) - resumen["objetivo"]) < 1e-6
+    for resultado in resumen["resultados"]:
+        if resultado["objetivo"] is not None:
+            assert resultado["objetivo"] >= objetivo_directo - 1e-6
+
+    # La cota usa la estructura por día que la relajación lineal no tiene: supera a la raíz del solver
+    cota = cota_inferior(empleados_test, roles_test, parametros, 1, 1, None, fijaciones)
+    relajacion, *_ = construir(parametros, fijaciones)
+    for v in relajacion.variables():
+        v.cat = LpContinuous
+    relajacion.solve(PULP_CBC_CMD(msg=False))
+    print(f"Cota inferior: {cota}, relajación lineal: {value(relajacion.objective)}")
+    assert value(relajacion.objective) < cota <= objetivo_directo + 1e-6
+
+    # Una incumbente que alcanza la cota gana sin lanzar solvers; sin cota queda sin demostrar
+    for cota_carrera in (None, cota):
+        prob_optimo, x_optimo, *_ = construir(parametros, fijaciones)
+        for v, valor in zip(prob_optimo.variables(), [v.varValue for v in prob_directo.variables()]):
+            v.varValue = valor
+        resumen = resolver_en_carrera(prob_optimo, 30, configuraciones=[], cota=cota_carrera)
+        print(f"Incumbente óptima con cota {cota_carrera}: {resumen['estado']}, probado: {resumen['optimo_probado']}")
+        assert resumen["ganador"] == "Greedy" and abs(resumen["objetivo"] - objetivo_directo) < 1e-6
+        assert resumen["optimo_probado"] == resumen["optimo_por_cota"] == alcanza_cota(objetivo_directo, cota_carrera)
+
+    # Si la cota no la alcanza la greedy, la carrera la usa sin cambiar el resultado
+    prob, x, resumen = carrera(parametros, fijaciones, cota)
+    assert abs(resumen["objetivo"] - objetivo_directo) < 1e-6
+    assert abs(value(prob.objective) - resumen["objetivo"]) < 1e-6
+
+    # La resolución directa sólo se saltea el solver cuando la cota lo justifica
+    sin_cota = resolver_desde_parametros(empleados_test, roles_test, parametros, usar_cota=False)
+    con_cota = resolver_desde_parametros(empleados_test, roles_test, parametros)
+    assert con_cota["estado"] == sin_cota["estado"] == "Optimal"
+    assert abs(con_cota["objetivo"] - sin_cota["objetivo"]) < 1e-6
+    infactible_sin_cota = resolver_desde_parametros(empleados_test, roles_test, parametros, 2, 1, usar_cota=False)
+    infactible = resolver_desde_parametros(empleados_test, roles_test, parametros, 2, 1)
+    print(f"Dos francos: {infactible['estado']} en {infactible['tiempo']:.2f}s (solver: {infactible_sin_cota['tiempo']:.2f}s)")
+    assert infactible["estado"] == infactible_sin_cota["estado"] == "Infeasible"
+
+    # Con preferencias no enteras la cota no se redondea y no debe cambiar el óptimo
+    parametros_fraccion = parametros_desde_json(dict(escenario_carrera, preferencias={
+        turno: {e: valor - 0.5 if valor else 0 for e, valor in preferencias.items()}
+        for turno, preferencias in escenario_carrera["preferencias"].items()
+    }))[2]
+    sin_cota = resolver_desde_parametros(empleados_test, roles_test, parametros_fraccion, usar_cota=False)
+    con_cota = resolver_desde_parametros(empleados_test, roles_test, parametros_fraccion)
+    print(f"Preferencias no enteras: {sin_cota['objetivo']} sin cota, {con_cota['objetivo']} con cota {con_cota['cota']}")
+    assert con_cota["estado"] == sin_cota["estado"] == "Optimal"
+    assert abs(con_cota["objetivo"] - sin_cota["objetivo"]) < 1e-6
+    assert con_cota["cota"] <= sin_cota["objetivo"] + 1e-6
+    print("Prueba de la carrera OK")
@@ -0,0 +1,43 @@
+from datos_prueba import escenario_test
+from escenarios import ajustar_demanda, barrido_escenarios, chequeo_rapido
+from modelo import resolver_desde_parametros
+from servicio import parametros_desde_json
+
+
+FRANCOS_VALORES = [0, 1, 2, 7]
+DOBLES_VALORES = [0, 1, 2]
+DELTAS_DEMANDA = [-1, 0, 1]
+
+
+if __name__ == "__main__":
+    empleados, roles, parametros, _, _, max_por_dia = parametros_desde_json(escenario_test)
+
+    barrido = barrido_escenarios(
+        empleados, roles, parametros, FRANCOS_VALORES, DOBLES_VALORES, DELTAS_DEMANDA,
+        max_procesos=2, max_turnos_por_dia=max_por_dia
+    )
+    print(barrido.to_string())
+    assert len(barrido) == len(FRANCOS_VALORES) * len(DOBLES_VALORES) * len(DELTAS_DEMANDA)
+    assert (barrido["Estado"] == "Descartado").any()
+    assert (barrido["Estado"] == "Optimal").any()
+
+    # Cada fila se compara con la resolución directa del mismo escenario
+    for _, fila in barrido.iterrows():
+        parametros_escenario = ajustar_demanda(parametros, fila["Ajuste Demanda"])
+        directo = resolver_desde_parametros(
+            empleados, roles, parametros_escenario, fila["Francos"], fila["Dobles"],
+            max_turnos_por_dia=max_por_dia
+        )
+        escenario = f"francos={fila['Francos']}, dobles={fila['Dobles']}, ajuste={fila['Ajuste Demanda']}"
+        if fila["Estado"] == "Descartado":
+            # El chequeo rápido sólo puede descartar escenarios que el solver confirma infactibles
+            assert directo["estado"] == "Infeasible", f"{escenario}: descartado pero es {directo['estado']}"
+            assert fila["Motivo"] == chequeo_rapido(
+                empleados, roles, parametros_escenario, fila["Francos"], fila["Dobles"], max_por_dia
+            )
+        else:
+            assert fila["Estado"] == directo["estado"], f"{escenario}: {fila['Estado']} != {directo['estado']}"
+            if directo["estado"] == "Optimal":
+                assert abs(fila["Objetivo"] - directo["objetivo"]) < 1e-6, f"{escenario}: objetivo distinto"
+                assert fila["Aux"] == directo["aux"]
+    print("Prueba del barrido de escenarios OK")
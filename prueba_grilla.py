@@ -0,0 +1,139 @@
+import pandas as pd
+
+from modelo import DIAS, indices_grilla, preparar_parametros, construir_modelo, resolver_desde_parametros
+from escenarios import chequeo_rapido
+
+
+# --- 1. Grilla de prueba: cuatro turnos por día, con un turno intermedio y un turno noche ---
+# El turno intermedio (I) se superpone con la mañana y la tarde, y la noche (N) termina a las
+# 7 del día siguiente, así que se superpone con la mañana del día siguiente.
+HORARIOS_TEST = {"M": (6, 14), "I": (10, 16), "T": (14, 22), "N": (22, 31)}
+
+grilla_test = pd.DataFrame([
+    {"Turno": f"{dia} {turno}", "Día": dia, "Inicio": inicio, "Fin": fin}
+    for dia in DIAS
+    for turno, (inicio, fin) in HORARIOS_TEST.items()
+]).set_index("Turno")
+turnos_test = list(grilla_test.index)
+
+empleados_test = [f"E{i}" for i in range(1, 9)]
+roles_test = ["Encargado", "Cajero"]
+
+habilidades_test = pd.DataFrame({
+    e: {"Encargado": i < 3, "Cajero": i >= 2} for i, e in enumerate(empleados_test)
+})
+
+# Preferencias fijas (1 = le gusta, 5 = no le gusta) y algunos turnos noche no disponibles
+preferencias_test = pd.DataFrame({
+    t: {
+        e: 0 if (t.endswith(" N") and i % 3 == 0) else 1 + (i * 7 + j * 3) % 5
+        for i, e in enumerate(empleados_test)
+    }
+    for j, t in enumerate(turnos_test)
+})
+
+requisitos_roles_test = pd.DataFrame({
+    t: {"Encargado": 1 if t.endswith((" M", " T")) else 0, "Cajero": 1}
+    for t in turnos_test
+})
+
+turnos_deseados_test = pd.DataFrame(
+    {
+        "Turnos Deseados": [6, 6, 6, 6, 5, 5, 5, 5],
+        # E4 sólo llega a 6 turnos si al menos dos son intermedios (6 horas)
+        "Horas Máximas": [None, None, None, 45, None, 40, None, None]
+    },
+    index=empleados_test
+)
+
+total_requerimientos_test = pd.DataFrame.from_dict(
+    {t: {" M": 2, " I": 1, " T": 2, " N": 1}[t[-2:]] for t in turnos_test},
+    orient='index', columns=['Empleados Necesarios']
+)
+
+FRANCOS, DOBLES, MAX_POR_DIA = 1, 1, 2
+
+
+# --- 2. Verificaciones sobre la planificación ---
+def verificar(parametros, resultado):
+    asignados = {e: [t for t in turnos_test if e in resultado["asignacion"][t]] for e in empleados_test}
+    for e, turnos_e in asignados.items():
+        assert len(turnos_e) == parametros["U"][e], f"{e} no tiene sus turnos deseados"
+        for i, t in enumerate(turnos_e):
+            for s in turnos_e[i + 1:]:
+                assert s not in parametros["solapados"][t], f"{e} trabaja {t} y {s}, que se superponen"
+        if parametros["Hmax"][e] is not None:
+            assert sum(parametros["H"][t] for t in turnos_e) <= parametros["Hmax"][e], f"{e} supera sus horas"
+        por_dia = [sum(t in turnos_e for t in parametros["turnos_por_dia"][m]) for m in parametros["dias"]]
+        assert max(por_dia) <= MAX_POR_DIA, f"{e} supera el máximo de turnos por día"
+        assert sum(n > 0 for n in por_dia) <= len(parametros["dias"]) - FRANCOS, f"{e} no tiene sus francos"
+        assert sum(n > 1 for n in por_dia) <= DOBLES, f"{e} supera los turnos dobles"
+
+    for t in turnos_test:
+        assert len(resultado["asignacion"][t]) >= parametros["Q"][t], f"{t} no cubre la demanda"
+        for r in roles_test:
+            cubiertos = sum(parametros["B"][r][e] for e in resultado["asignacion"][t])
+            assert cubiertos >= parametros["V"][t][r], f"{t} no cubre el rol {r}"
+
+
+if __name__ == "__main__":
+    parametros = preparar_parametros(
+        habilidades_test,
+        preferencias_test,
+        requisitos_roles_test,
+        turnos_deseados_test,
+        total_requerimientos_test,
+        grilla_test
+    )
+    assert parametros["H"]["Lunes N"] == 9 and parametros["H"]["Lunes I"] == 6
+    assert "Martes M" in parametros["solapados"]["Lunes N"]
+
+    # Los grupos por inicio excluyen exactamente los pares que se superponen
+    pares_grupos = {
+        frozenset((t, s)) for grupo in parametros["grupos_solapados"].values() for t in grupo for s in grupo if t != s
+    }
+    pares_solapados = {frozenset((t, s)) for t in turnos_test for s in parametros["solapados"][t]}
+    assert pares_grupos == pares_solapados
+    prob, *_ = construir_modelo(empleados_test, roles_test, parametros, FRANCOS, DOBLES, MAX_POR_DIA)
+    restricciones_solapamiento = [n for n in prob.constraints if n.startswith("Solapamiento_")]
+    print(f"Solapamiento: {len(restricciones_solapamiento)} restricciones para {len(pares_solapados)} pares")
+    assert len(restricciones_solapamiento) <= len(turnos_test) * len(empleados_test)
+
+    # Turnos de 8 horas que empiezan cada hora: los pares crecen en forma cuadrática, los grupos no
+    escalonados = indices_grilla(pd.DataFrame([
+        {"Turno": f"Lunes {h}", "Día": "Lunes", "Inicio": h, "Fin": h + 8} for h in range(24)
+    ]).set_index("Turno"))
+    pares = sum(len(s) for s in escalonados["solapados"].values()) // 2
+    print(f"Escalonados: {len(escalonados['grupos_solapados'])} grupos para {pares} pares")
+    assert len(escalonados["grupos_solapados"]) < 24 < pares
+
+    assert chequeo_rapido(empleados_test, roles_test, parametros, FRANCOS, DOBLES, MAX_POR_DIA) is None
+    resultado = resolver_desde_parametros(
+        empleados_test, roles_test, parametros, FRANCOS, DOBLES, max_turnos_por_dia=MAX_POR_DIA
+    )
+    sin_presolve = resolver_desde_parametros(
+        empleados_test, roles_test, parametros, FRANCOS, DOBLES, max_turnos_por_dia=MAX_POR_DIA, presolve=False
+    )
+    print(f"Grilla de 4 turnos: {resultado['estado']}, objetivo: {resultado['objetivo']}")
+    assert resultado["estado"] == sin_presolve["estado"] == "Optimal"
+    assert resultado["objetivo"] == sin_presolve["objetivo"]
+    verificar(parametros, resultado)
+
+    # Grilla sin el domingo con las tablas completas: los turnos del domingo no cuentan
+    sin_domingo = grilla_test[grilla_test["Día"] != "Domingo"]
+    parametros = preparar_parametros(
+        habilidades_test,
+        preferencias_test,
+        requisitos_roles_test,
+        turnos_deseados_test.assign(**{"Turnos Deseados": [5, 5, 5, 5, 4, 4, 4, 4]}),
+        total_requerimientos_test,
+        sin_domingo
+    )
+    motivo = chequeo_rapido(empleados_test, roles_test, parametros, FRANCOS, DOBLES, MAX_POR_DIA)
+    resultado = resolver_desde_parametros(
+        empleados_test, roles_test, parametros, FRANCOS, DOBLES, max_turnos_por_dia=MAX_POR_DIA
+    )
+    print(f"Grilla sin domingo: chequeo {motivo}, {resultado['estado']}, objetivo: {resultado['objetivo']}")
+    assert motivo is None
+    assert resultado["estado"] == "Optimal"
+    print("Prueba de la grilla OK")
@@ -0,0 +1,70 @@
+import math
+
+from pulp import *
+
+from modelo import construir_modelo
+from presolve import propagar
+from sensibilidad import VARIABLES_DE_DIA, analizar_sensibilidad
+from datos_prueba import empleados_test, roles_test
+from prueba_carrera import escenario_carrera
+from servicio import parametros_desde_json
+
+
+# --- 1. Relajación con los días de la solución fijos, para comparar con los duales ---
+def valor_fijado(parametros, solucion):
+    lp, *_ = construir_modelo(empleados_test, roles_test, parametros, 1, 1, None)
+    for v in lp.variables():
+        if v.name.startswith(VARIABLES_DE_DIA):
+            v.bounds(round(solucion[v.name]), round(solucion[v.name]))
+        v.cat = LpContinuous
+    lp.solve(PULP_CBC_CMD(msg=False))
+    return value(lp.objective) if LpStatus[lp.status] == "Optimal" else math.inf
+
+
+def con_cambio(parametros, clave, indice, delta):
+    cambiados = dict(parametros)
+    if clave == "V":
+        t, r = indice
+        cambiados["V"] = {s: dict(valores) for s, valores in parametros["V"].items()}
+        cambiados["V"][t][r] += delta
+    else:
+        cambiados[clave] = dict(parametros[clave], **{indice: parametros[clave][indice] + delta})
+    return cambiados
+
+
+if __name__ == "__main__":
+    # Caj LV tiene todos sus turnos fijados por el presolve: igual debe tener costo marginal
+    parametros = parametros_desde_json(escenario_carrera)[2]
+    fijaciones = propagar(empleados_test, roles_test, parametros, 1, 1)
+    prob, *_ = construir_modelo(empleados_test, roles_test, parametros, 1, 1, None, fijaciones)
+    prob.solve(PULP_CBC_CMD(msg=False))
+    assert LpStatus[prob.status] == "Optimal"
+    solucion = {v.name: v.varValue for v in prob.variables()}
+
+    sensibilidad = analizar_sensibilidad(prob, empleados_test, roles_test, parametros)
+    print(sensibilidad["por_turno"].to_string())
+    print(sensibilidad["por_empleado"].to_string())
+    assert sensibilidad["estado"] == "Optimal"
+    assert not sensibilidad["por_turno"].isna().any()
+    assert not sensibilidad["por_turno_rol"].isna().any().any()
+    assert not sensibilidad["por_empleado"].isna().any()
+
+    # El valor de la relajación es convexo en los requerimientos y cada dual es un subgradiente:
+    # volver a resolver con un requerimiento más (o menos) nunca cuesta menos que lo que predice
+    base = valor_fijado(parametros, solucion)
+    assert abs(base - value(prob.objective)) < 1e-6
+    duales = [("Q", t, dual) for t, dual in sensibilidad["por_turno"].items()]
+    duales += [("V", (t, r), sensibilidad["por_turno_rol"].loc[t, r]) for t in parametros["turnos"] for r in roles_test]
+    duales += [("U", e, dual) for e, dual in sensibilidad["por_empleado"].items()]
+    exactos = 0
+    for clave, indice, dual in duales:
+        for delta in (1, -1):
+            cambiado = valor_fijado(con_cambio(parametros, clave, indice, delta), solucion)
+            assert cambiado >= base + dual * delta - 1e-6, f"{clave}[{indice}] {delta:+d}: {cambiado} < {base} + {dual} * {delta}"
+            exactos += abs(cambiado - (base + dual * delta)) < 1e-6
+    print(f"Duales verificados: {len(duales)}, predicciones exactas: {exactos} de {2 * len(duales)}")
+    assert exactos > 0
+
+    relajacion = analizar_sensibilidad(prob, empleados_test, roles_test, parametros, modo="relajacion")
+    assert relajacion["estado"] == "Optimal" and not relajacion["por_turno"].isna().any()
+    print("Prueba de la sensibilidad OK")
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import threading
+import urllib.error
+import urllib.request
+
+from datos_prueba import empleados_test, escenario_test, turnos_test
+from servicio import ServicioPlanificacion, crear_servidor
+
+
+def variante(francos, dobles):
+    return dict(escenario_test, cantidad_de_francos=francos, cantidad_de_dobles=dobles)
+
+
+# --- 1. Cliente asíncrono ---
+def _post(url, escenario):
+    solicitud = urllib.request.Request(
+        url, data=json.dumps(escenario).encode("utf-8"), headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(solicitud, timeout=60) as respuesta:
+            return respuesta.status, json.loads(respuesta.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+async def planificar(url, escenario):
+    return await asyncio.to_thread(_post, url, escenario)
+
+
+async def main(url):
+    # 10 solicitudes idénticas al mismo tiempo: deben compartir una sola resolución
+    respuestas = await asyncio.gather(*(planificar(url, escenario_test) for _ in range(10)))
+    codigos = [codigo for codigo, _ in respuestas]
+    compartidas = sum(cuerpo.get("compartido", False) for _, cuerpo in respuestas)
+    print(f"Idénticas -> códigos: {codigos}, compartidas: {compartidas}")
+    print(f"Estado: {respuestas[0][1]['estado']}, objetivo: {respuestas[0][1]['objetivo']}")
+    assert codigos == [200] * 10
+    assert compartidas > 0
+    assert len({json.dumps(cuerpo["asignacion"], sort_keys=True) for _, cuerpo in respuestas}) == 1
+
+    # 20 escenarios distintos con 1 proceso y cola de 2: algunos deben recibir 429
+    respuestas = await asyncio.gather(*(planificar(url, variante(f, d)) for f in range(4) for d in range(5)))
+    codigos = [codigo for codigo, _ in respuestas]
+    print(f"Distintas -> 200: {codigos.count(200)}, 429: {codigos.count(429)}")
+    assert codigos.count(429) > 0
+    assert set(codigos) <= {200, 429}
+
+    # Escenario inválido
+    codigo, cuerpo = await planificar(url, {"empleados": ["Juan"]})
+    print(f"Inválido -> {codigo}: {cuerpo['error']}")
+    assert codigo == 400
+
+    # Grilla con una fila sin día y preferencias no numéricas: también son escenarios inválidos
+    grilla_sin_dia = [{"Turno": t, "Inicio": 8, "Fin": 16, "Horas": 8} for t in turnos_test]
+    preferencias_texto = {t: {e: "mucho" for e in empleados_test} for t in turnos_test}
+    for invalido in (
+        dict(escenario_test, grilla_turnos=grilla_sin_dia),
+        dict(escenario_test, preferencias=preferencias_texto)
+    ):
+        codigo, cuerpo = await planificar(url, invalido)
+        print(f"Inválido -> {codigo}: {cuerpo['error']}")
+        assert codigo == 400
+
+
+if __name__ == "__main__":
+    servicio = ServicioPlanificacion(max_procesos=1, max_en_cola=2)
+    servidor = crear_servidor(servicio, puerto=0)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(main(f"http://127.0.0.1:{servidor.server_port}/planificar"))
+        print("Prueba del servicio OK")
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+        servicio.cerrar()
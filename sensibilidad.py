@@ -0,0 +1,94 @@
+import pandas as pd
+from pulp import *
+
+from modelo import construir_modelo
+
+
+VARIABLES_DE_DIA = ("TrabajaDia", "DescansaDia", "DobleTurno", "AuxiliarMinTurnos")
+
+
+def _nombre_pulp(nombre):
+    # PuLP reemplaza estos caracteres por '_' en los nombres de las restricciones
+    return nombre.translate(str.maketrans("-+[] ->/", "________"))
+
+
+def analizar_sensibilidad(
+    prob: LpProblem,
+    empleados: list,
+    roles: list,
+    parametros: dict,
+    cantidad_de_francos: int = 1,
+    cantidad_de_dobles: int = 1,
+    max_turnos_por_dia: int = None,
+    modo: str = "fijada"
+):
+    """
+    Estima con una sola resolución lineal cuánto cuesta cambiar los requerimientos del modelo.
+
+    Resuelve una relajación lineal del modelo y lee los precios sombra (duales) de las
+    restricciones `Cubrir_demanda_total_*`, `Roles_cubiertos_*` y `Turnos_totales_*`. Cada
+    dual es el cambio estimado del objetivo al aumentar en uno el lado derecho: un empleado
+    más necesario en el turno, un empleado más de un rol en el turno o un turno deseado más
+    para el empleado. Es una estimación local: para cambios grandes conviene volver a resolver.
+
+    La relajación se construye de nuevo a partir de los parámetros, sin las fijaciones del
+    presolve: si las asignaciones de un turno quedaran fijas, sus restricciones no tendrían
+    dual aunque el requerimiento sí tenga un costo.
+
+    Args:
+        prob (LpProblem): Problema resuelto (no se modifica). En el modo 'fijada' se toman de él
+            los días trabajados, descansos y dobles de la solución.
+        empleados (list): Lista de nombres de empleados.
+        roles (list): Lista de nombres de roles.
+        parametros (dict): Parámetros con los que se construyó `prob` (ver `preparar_parametros`).
+        cantidad_de_francos (int): Cantidad mínima de días de descanso por empleado.
+        cantidad_de_dobles (int): Cantidad máxima de días con más de un turno por empleado.
+        max_turnos_por_dia (int): Cantidad máxima de turnos por día por empleado (None = sin límite).
+        modo (str): 'fijada' fija los días trabajados, descansos y dobles de la solución entera
+            de `prob` y relaja sólo las asignaciones a turnos; 'relajacion' relaja todas las
+            variables enteras.
+
+    Returns:
+        dict: Diccionario con
+            - 'estado' (str): Estado de la resolución lineal.
+            - 'por_turno' (pd.Series): Costo marginal de un empleado más en cada turno.
+            - 'por_turno_rol' (pd.DataFrame): Costo marginal de un empleado más de cada rol (columnas) en cada turno (filas).
+            - 'por_empleado' (pd.Series): Costo marginal de un turno deseado más para cada empleado.
+
+    Raises:
+        ValueError: Si el modo no es válido, o si es 'fijada' y `prob` no tiene una solución cargada.
+    """
+    if modo not in ("fijada", "relajacion"):
+        raise ValueError(f"Modo de análisis desconocido: {modo}")
+
+    turnos = parametros["turnos"]
+    lp, *_ = construir_modelo(
+        empleados, roles, parametros, cantidad_de_francos, cantidad_de_dobles, max_turnos_por_dia, fijaciones=None
+    )
+    solucion = {v.name: v.varValue for v in prob.variables()}
+    for v in lp.variables():
+        if modo == "fijada" and v.name.startswith(VARIABLES_DE_DIA):
+            if solucion.get(v.name) is None:
+                raise ValueError("El modo 'fijada' necesita que el problema esté resuelto")
+            v.bounds(round(solucion[v.name]), round(solucion[v.name]))
+        v.cat = LpContinuous
+    lp.solve(PULP_CBC_CMD(msg=False))
+
+    duales = {nombre: restriccion.pi for nombre, restriccion in lp.constraints.items()}
+
+    def dual(nombre):
+        valor = duales.get(_nombre_pulp(nombre))
+        return valor if valor is not None else float("nan")
+
+    return {
+        "estado": LpStatus[lp.status],
+        "por_turno": pd.Series(
+            {t: dual(f"Cubrir_demanda_total_{t}") for t in turnos}, name="Costo Marginal"
+        ),
+        "por_turno_rol": pd.DataFrame(
+            {r: {t: dual(f"Roles_cubiertos_{t}_{r}") for t in turnos} for r in roles}
+        ).reindex(turnos),
+        "por_empleado": pd.Series(
+            {e: dual(f"Turnos_totales_{e}") for e in empleados}, name="Costo Marginal"
+        ),
+    }
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from modelo import preparar_parametros, resolver_desde_parametros
+
+
+# Ejemplo de escenario aceptado por POST /planificar (mismas tablas que las secciones 0 a 7 de la app):
+# {
+#     "empleados": ["Juan", "Maria"],
+#     "roles": ["Cajero", "Mozo"],
+#     "habilidades": {"Juan": {"Cajero": true, "Mozo": false}, "Maria": {...}},
+#     "preferencias": {"Lunes TM": {"Juan": 1, "Maria": 0}, ...},
+#     "requisitos_roles": {"Lunes TM": {"Cajero": 1, "Mozo": 0}, ...},
+#     "turnos_deseados": {"Juan": 5, "Maria": 4},
+#     "empleados_necesarios": {"Lunes TM": 2, ...},
+#     "cantidad_de_francos": 1,
+#     "cantidad_de_dobles": 1,
+#     "max_turnos_por_dia": 2,                                     (opcional)
+#     "horas_maximas": {"Juan": 40},                               (opcional)
+#     "grilla_turnos": [                                           (opcional, default: TM y TT)
+#         {"Turno": "Lunes TM", "Día": "Lunes", "Inicio": 8, "Fin": 16, "Horas": 8}, ...
+#     ]
+# }
+
+
+class ServicioSaturado(Exception):
+    """Se alcanzó el límite de planificaciones en curso y en cola."""
+
+
+def parametros_desde_json(escenario: dict):
+    """
+    Convierte un escenario recibido como JSON en los argumentos de `resolver_desde_parametros`.
+
+    Args:
+        escenario (dict): Escenario con las claves del ejemplo al inicio de este módulo.
+
+    Returns:
+        tuple: (empleados, roles, parametros, cantidad_de_francos, cantidad_de_dobles, max_turnos_por_dia).
+
+    Raises:
+        ValueError: Si falta alguna clave o alguna tabla está incompleta.
+    """
+    try:
+        empleados = list(escenario["empleados"])
+        roles = list(escenario["roles"])
+        # Mismas orientaciones que usa la app al llamar a resolver_planificacion_turnos
+        habilidades_df = pd.DataFrame(escenario["habilidades"]).reindex(index=roles, columns=empleados)
+        preferencias_df = pd.DataFrame(escenario["preferencias"]).reindex(index=empleados)
+        requisitos_roles_df = pd.DataFrame(escenario["requisitos_roles"]).reindex(index=roles)
+        turnos_deseados_df = pd.DataFrame.from_dict(
+            escenario["turnos_deseados"], orient='index', columns=['Turnos Deseados']
+        ).reindex(empleados)
+        turnos_deseados_df['Horas Máximas'] = pd.Series(escenario.get("horas_maximas", {}), dtype=float)
+        total_requerimientos_df = pd.DataFrame.from_dict(
+            escenario["empleados_necesarios"], orient='index', columns=['Empleados Necesarios']
+        )
+        francos = int(escenario.get("cantidad_de_francos", 1))
+        dobles = int(escenario.get("cantidad_de_dobles", 1))
+        max_por_dia = escenario.get("max_turnos_por_dia")
+        max_por_dia = int(max_por_dia) if max_por_dia is not None else None
+        grilla_turnos_df = None
+        if "grilla_turnos" in escenario:
+            grilla_turnos_df = pd.DataFrame(escenario["grilla_turnos"]).set_index("Turno")
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Escenario inválido: {e}") from e
+
+    tablas = [
+        habilidades_df,
+        preferencias_df,
+        requisitos_roles_df,
+        turnos_deseados_df[['Turnos Deseados']],
+        total_requerimientos_df
+    ]
+    if any(tabla.isna().any().any() for tabla in tablas):
+        raise ValueError("Escenario inválido: hay empleados, roles o turnos sin datos en alguna tabla")
+
+    try:
+        parametros = preparar_parametros(
+            habilidades_df,
+            preferencias_df,
+            requisitos_roles_df,
+            turnos_deseados_df,
+            total_requerimientos_df,
+            grilla_turnos_df
+        )
+    except (KeyError, TypeError, ValueError) as e:  # Grilla sin columnas, valores no numéricos, etc.
+        raise ValueError(f"Escenario inválido: {e}") from e
+    return empleados, roles, parametros, francos, dobles, max_por_dia
+
+
+class ServicioPlanificacion:
+    """
+    Resuelve escenarios en un pool de procesos acotado.
+
+    Los escenarios idénticos que llegan mientras otro igual está en curso comparten
+    el mismo resultado (se identifican por el hash de su JSON). Cuando hay más de
+    `max_procesos + max_en_cola` planificaciones distintas en curso, `enviar`
+    rechaza las nuevas con `ServicioSaturado`. Cada planificación se corta a los
+    `tiempo_limite` segundos para que ninguna ocupe un proceso indefinidamente.
+    """
+
+    def __init__(self, max_procesos: int = 2, max_en_cola: int = 8, tiempo_limite: float = 60):
+        self.max_procesos = max_procesos
+        self.max_en_cola = max_en_cola
+        self.tiempo_limite = tiempo_limite
+        self._executor = ProcessPoolExecutor(max_workers=max_procesos)
+        self._lock = threading.Lock()
+        self._en_curso = {}  # hash del escenario -> Future
+
+    @staticmethod
+    def hash_escenario(escenario: dict):
+        return hashlib.sha256(json.dumps(escenario, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def enviar(self, escenario: dict):
+        """
+        Encola un escenario para resolver.
+
+        Returns:
+            tuple: (future, compartido), donde `compartido` indica que el resultado se
+                comparte con una solicitud idéntica que ya estaba en curso.
+
+        Raises:
+            ValueError: Si el escenario es inválido.
+            ServicioSaturado: Si se alcanzó el límite de planificaciones en curso.
+        """
+        clave = self.hash_escenario(escenario)
+        with self._lock:
+            future = self._en_curso.get(clave)
+            if future is not None:
+                return future, True
+
+        # La conversión se hace fuera del lock para no frenar al resto de las solicitudes
+        empleados, roles, parametros, francos, dobles, max_por_dia = parametros_desde_json(escenario)
+
+        with self._lock:
+            future = self._en_curso.get(clave)
+            if future is not None:
+                return future, True
+            if len(self._en_curso) >= self.max_procesos + self.max_en_cola:
+                raise ServicioSaturado()
+
+            future = self._executor.submit(
+                resolver_desde_parametros,
+                empleados, roles, parametros, francos, dobles, self.tiempo_limite, max_por_dia
+            )
+            self._en_curso[clave] = future
+
+        future.add_done_callback(lambda _: self._liberar(clave))
+        return future, False
+
+    def _liberar(self, clave):
+        with self._lock:
+            self._en_curso.pop(clave, None)
+
+    def cerrar(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _ManejadorPlanificacion(BaseHTTPRequestHandler):
+    servicio = None  # ServicioPlanificacion, asignado por crear_servidor
+
+    def _responder(self, codigo, cuerpo, encabezados=None):
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8")
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        for nombre, valor in (encabezados or {}).items():
+            self.send_header(nombre, valor)
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def do_GET(self):
+        if self.path != "/salud":
+            self._responder(404, {"error": "Ruta no encontrada"})
+            return
+        self._responder(200, {"estado": "ok"})
+
+    def do_POST(self):
+        if self.path != "/planificar":
+            self._responder(404, {"error": "Ruta no encontrada"})
+            return
+
+        try:
+            largo = int(self.headers.get("Content-Length", 0))
+            escenario = json.loads(self.rfile.read(largo))
+            future, compartido = self.servicio.enviar(escenario)
+        except ServicioSaturado:
+            self._responder(429, {"error": "Demasiadas planificaciones en curso"}, {"Retry-After": "1"})
+            return
+        except ValueError as e:  # Incluye JSON mal formado
+            self._responder(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._responder(500, {"error": f"Error al recibir el escenario: {e}"})
+            return
+
+        try:
+            resultado = future.result()
+        except Exception as e:
+            self._responder(500, {"error": f"Error al resolver el modelo: {e}"})
+            return
+
+        self._responder(200, dict(resultado, compartido=compartido))
+
+    def log_message(self, formato, *args):
+        pass
+
+
+def crear_servidor(servicio: ServicioPlanificacion, host: str = "127.0.0.1", puerto: int = 8000):
+    """
+    Crea el servidor HTTP (sin iniciarlo) que atiende las rutas:
+
+    - POST /planificar: recibe un escenario JSON y devuelve la planificación.
+      Responde 400 si el escenario es inválido y 429 si el servicio está saturado.
+    - GET /salud: responde {"estado": "ok"}.
+
+    Usar `puerto=0` para que el sistema elija un puerto libre (`servidor.server_port`).
+    """
+    manejador = type("ManejadorPlanificacion", (_ManejadorPlanificacion,), {"servicio": servicio})
+    return ThreadingHTTPServer((host, puerto), manejador)
+
+
+if __name__ == "__main__":
+    # Uso: python servicio.py [puerto]
+    puerto = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    servicio = ServicioPlanificacion()
+    servidor = crear_servidor(servicio, puerto=puerto)
+    print(f"Servicio de planificación escuchando en http://127.0.0.1:{puerto}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servicio.cerrar()